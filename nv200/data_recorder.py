@@ -6,8 +6,9 @@ from nv200.nv200_device import NV200Device
 from nv200.shared_types import TimeSeries
 from nv200.utils import wait_until
 import math
+import numpy as np
 from typing import List
-from enum import Enum
+from enum import IntEnum
 from collections import namedtuple
 from nv200._internal._reentrant_lock import _ReentrantAsyncLock
 
@@ -15,8 +16,15 @@ from nv200._internal._reentrant_lock import _ReentrantAsyncLock
 # Global module locker
 logger = logging.getLogger(__name__)
 
+# Command templates of the data recorder setters
+_RECSRC_CMD = "recsrc,%d,%d"
+_RECAST_CMD = "recast,%d"
+_RECSTR_CMD = "recstr,%d"
+_RECLEN_CMD = "reclen,%d"
+_RECRUN_CMD = "recrun,%d"
 
-class DataRecorderSource(Enum):
+
+class DataRecorderSource(IntEnum):
     """
     Enum representing the source of data to be stored in the data recorder channel,
     ignoring the buffer (A or B) distinction.
@@ -45,10 +53,10 @@ class DataRecorderSource(Enum):
 
     @classmethod
     def from_value(cls, value : int):
-        if value in cls._value2member_map_:
-            return cls(value)
-        else:
+        member = cls._value2member_map_.get(value)
+        if member is None:
             raise ValueError(f"Invalid recsrc value: {value}")
+        return member
 
     def __repr__(self):
         """
@@ -63,20 +71,23 @@ class DataRecorderSource(Enum):
         This method is used to provide a more user-friendly string representation for display,
         such as in a user interface or logs.
         """
-        # Dictionary mapping enum names to human-readable strings
-        human_readable = {
-            DataRecorderSource.PIEZO_POSITION: "Piezo Position [μm or mrad]",
-            DataRecorderSource.SETPOINT: "Setpoint [μm or mrad]",
-            DataRecorderSource.PIEZO_VOLTAGE: "Piezo Voltage [V]",
-            DataRecorderSource.POSITION_ERROR: "Position Error",
-            DataRecorderSource.ABS_POSITION_ERROR: "Absolute Position Error",
-            DataRecorderSource.PIEZO_CURRENT_1: "Piezo Current 1 [A]",
-            DataRecorderSource.PIEZO_CURRENT_2: "Piezo Current 2 [A]"
-        }
-        return human_readable.get(self, self.name)  # Fallback to enum name if not found
+        return _DATA_RECORDER_SOURCE_LABELS.get(self, self.name)  # Fallback to enum name if not found
+
+
+# Human-readable labels of the data recorder sources - defined outside of the enum
+# class body because IntEnum would turn a class attribute into an enum member
+_DATA_RECORDER_SOURCE_LABELS = {
+    DataRecorderSource.PIEZO_POSITION: "Piezo Position [μm or mrad]",
+    DataRecorderSource.SETPOINT: "Setpoint [μm or mrad]",
+    DataRecorderSource.PIEZO_VOLTAGE: "Piezo Voltage [V]",
+    DataRecorderSource.POSITION_ERROR: "Position Error",
+    DataRecorderSource.ABS_POSITION_ERROR: "Absolute Position Error",
+    DataRecorderSource.PIEZO_CURRENT_1: "Piezo Current 1 [A]",
+    DataRecorderSource.PIEZO_CURRENT_2: "Piezo Current 2 [A]"
+}
     
 
-class RecorderAutoStartMode(Enum):
+class RecorderAutoStartMode(IntEnum):
     """
     Enum representing the autostart mode of the data recorder.
     """
@@ -94,10 +105,10 @@ class RecorderAutoStartMode(Enum):
         """
         Given a mode value, return the corresponding RecorderAutoStartMode enum.
         """
-        for item in cls:
-            if item.value == value:
-                return item
-        raise ValueError(f"Invalid RecorderAutoStartMode value: {value}")
+        member = cls._value2member_map_.get(value)
+        if member is None:
+            raise ValueError(f"Invalid RecorderAutoStartMode value: {value}")
+        return member
 
     def __repr__(self):
         return f"{self.__class__.__name__}.{self.name}"
@@ -127,12 +138,12 @@ class DataRecorder:
             sample_time_us (int): The sampling time in microseconds.
             sample_factor (int): A factor used to calculate the sample time from the base sample time.
         """
-        def __init__(self, values: list, sample_time_ms: float, source: DataRecorderSource):
+        def __init__(self, values: np.ndarray, sample_time_ms: float, source: DataRecorderSource):
             """
             Initialize the ChannelData instance with amplitude values, sample time, and source.
             
             Args:
-                values (list): The amplitude values corresponding to the waveform.
+                values (np.ndarray): The amplitude values corresponding to the waveform.
                 sample_time_ms (int): The sample time in milliseconds (sampling interval).
                 source (str): The data recorder source
             """
@@ -169,25 +180,38 @@ class DataRecorder:
         self._dev : NV200Device = device
         self._sample_rate : float | None = None
 
+    def invalidate(self):
+        """
+        Forgets the recorder parameters last written to the device.
+
+        Call this if the device state may have diverged from the values in the
+        command cache of the device, e.g. after a reconnect, so that the next call to
+        `set_recording_duration_ms` writes the parameters again.
+        """
+        self._sample_rate = None
+        self._dev._invalidate_cached_value(_RECSTR_CMD % 0)
+        self._dev._invalidate_cached_value(_RECLEN_CMD % 0)
+
 
     async def set_data_source(self, channel: int, source: DataRecorderSource):
         """
         Sets the channel and the source of data to be stored in the data recorder channel.
         """
-        await self._dev.write(f"recsrc,{channel},{source.value}")
+        await self._dev.write(_RECSRC_CMD % (channel, source))
 
 
     async def set_autostart_mode(self, mode: RecorderAutoStartMode):
         """
         Sets the autostart mode of the data recorder.
         """
-        await self._dev.write(f"recast,{mode.value}")
+        await self._dev.write(_RECAST_CMD % mode)
 
     async def set_recorder_stride(self, stride: int):
         """
         Sets the recorder stride.
         """
-        await self._dev.write(f"recstr,{stride}")
+        await self._dev.write(_RECSTR_CMD % stride)
+        self._dev._cache_written_value("recstr", stride)
         self._sample_rate = self.NV200_RECORDER_SAMPLE_RATE_HZ / stride
 
     async def set_sample_buffer_size(self, buffer_size: int):
@@ -199,7 +223,8 @@ class DataRecorder:
         """
         if not 1 <= buffer_size <= self.NV200_RECORDER_BUFFER_SIZE:
             raise ValueError(f"buffer_size must be between 0 and {self.NV200_RECORDER_BUFFER_SIZE}, got {buffer_size}")
-        await self._dev.write(f"reclen,{buffer_size}")
+        await self._dev.write(_RECLEN_CMD % buffer_size)
+        self._dev._cache_written_value("reclen", buffer_size)
 
     @classmethod
     def get_sample_rate_for_duration(cls, milliseconds: float) -> float:
@@ -229,7 +254,8 @@ class DataRecorder:
 
         This method calculates the appropriate stride, sample rate, and buffer size based on the 
         specified recording duration and the recorder's configuration. It then updates the recorder 
-        settings to match these calculated values.
+        settings to match these calculated values. Values that the command cache of the device
+        shows as already set are not sent to the device again.
 
         Args:
             milliseconds (float): The desired recording duration in milliseconds.
@@ -240,21 +266,86 @@ class DataRecorder:
         Raises:
             ValueError: If the calculated buffer size or stride is invalid.
         """
+        rec_param = self._recorder_params_for_duration(milliseconds)
+        await self._dev.write_batch(self._recording_duration_cmds(rec_param))
+        self._apply_recorder_params(rec_param)
+        return rec_param
+
+    async def configure(
+        self,
+        source_ch0: DataRecorderSource,
+        source_ch1: DataRecorderSource,
+        autostart_mode: RecorderAutoStartMode,
+        duration_ms: float
+    ) -> RecorderParam:
+        """
+        Configures the data sources of both channels, the autostart mode and the recording
+        duration with a single transport write instead of one write per setting.
+
+        Args:
+            source_ch0 (DataRecorderSource): The data source of channel 0.
+            source_ch1 (DataRecorderSource): The data source of channel 1.
+            autostart_mode (RecorderAutoStartMode): The autostart mode of the data recorder.
+            duration_ms (float): The desired recording duration in milliseconds.
+
+        Returns:
+            RecorderParam: An object containing the updated buffer length, stride, and sample rate.
+
+        Example:
+            >>> await recorder.configure(DataRecorderSource.PIEZO_POSITION, DataRecorderSource.PIEZO_VOLTAGE,
+            ...     RecorderAutoStartMode.START_ON_SET_COMMAND, 100)
+        """
+        rec_param = self._recorder_params_for_duration(duration_ms)
+        await self._dev.write_batch([
+            _RECSRC_CMD % (0, source_ch0),
+            _RECSRC_CMD % (1, source_ch1),
+            _RECAST_CMD % autostart_mode,
+            *self._recording_duration_cmds(rec_param)
+        ])
+        self._apply_recorder_params(rec_param)
+        return rec_param
+
+    def _recorder_params_for_duration(self, milliseconds: float) -> RecorderParam:
+        """
+        Calculates the stride, sample rate and buffer size for the given recording duration.
+        """
         duration_s = milliseconds / 1000.0
         buffer_duration_s = 1 / self.NV200_RECORDER_SAMPLE_RATE_HZ * self.NV200_RECORDER_BUFFER_SIZE
         stride = int(duration_s / buffer_duration_s) + 1
         sample_rate = self.NV200_RECORDER_SAMPLE_RATE_HZ / stride
         buflen = math.ceil(sample_rate * duration_s)
         buflen = min(buflen, self.NV200_RECORDER_BUFFER_SIZE)
-        await self.set_recorder_stride(stride)
-        await self.set_sample_buffer_size(buflen)
+        if not 1 <= buflen <= self.NV200_RECORDER_BUFFER_SIZE:
+            raise ValueError(f"buffer_size must be between 0 and {self.NV200_RECORDER_BUFFER_SIZE}, got {buflen}")
         return self.RecorderParam(buflen, stride, sample_rate)
 
+    def _recording_duration_cmds(self, rec_param: RecorderParam) -> List[str]:
+        """
+        Returns the stride and buffer size commands for the given parameters. Commands whose
+        value is already held by the command cache of the device are left out. Every write of
+        these commands, i.e. by `PiezoDeviceBase.restore_parameters`, updates or invalidates
+        the cache.
+        """
+        cmds = []
+        if not self._dev._is_cached_value("recstr", rec_param.stride):
+            cmds.append(_RECSTR_CMD % rec_param.stride)
+        if not self._dev._is_cached_value("reclen", rec_param.bufsize):
+            cmds.append(_RECLEN_CMD % rec_param.bufsize)
+        return cmds
+
+    def _apply_recorder_params(self, rec_param: RecorderParam):
+        """
+        Stores the parameters written to the device in the command cache of the device.
+        """
+        self._dev._cache_written_value("recstr", rec_param.stride)
+        self._dev._cache_written_value("reclen", rec_param.bufsize)
+        self._sample_rate = self.NV200_RECORDER_SAMPLE_RATE_HZ / rec_param.stride
+
     async def start_recording(self, start : bool = True):
         """
         Starts / stops the data recorder.
         """
-        await self._dev.write(f"recrun,{int(start)}")
+        await self._dev.write(_RECRUN_CMD % start)
 
     async def stop_recording(self):
         """
@@ -297,7 +388,7 @@ class DataRecorder:
 
         Returns:
             ChannelRecordingData: An object containing the recording source as a string 
-            and a list of floating-point numbers representing the recorded data.
+            and a NumPy array of floating-point numbers representing the recorded data.
 
         Raises:
             Any exceptions raised by the underlying device communication methods.
@@ -307,14 +398,18 @@ class DataRecorder:
 
         async with self._dev.lock:
             recsrc = DataRecorderSource.from_value(await self._dev.read_int_value(cmd = f"recsrc,{channel}", param_index = 1))
-            number_strings = await self._dev.read_values(f'recoutf,{channel}', self.BUFFER_READ_TIMEOUT_SECS)
+            response = await self._dev.read_stripped_response_string(f'recoutf,{channel}', self.BUFFER_READ_TIMEOUT_SECS)
             if self._sample_rate is None:
                 stride = await self._dev.read_int_value("recstr")
                 self._sample_rate = self.NV200_RECORDER_SAMPLE_RATE_HZ / stride
 
-        numbers = []
-        for num in number_strings[1:]:  # starts from the second element
-            numbers.append(float(num))
+        if response.startswith("error"):
+            self._dev._parse_response(response)  # raises the matching DeviceError
+
+        # The response is recoutf,<channel>,<values...> - the values are parsed directly from
+        # the string in C without creating a Python string object per value
+        fields = response.split(',', 2)
+        numbers = np.fromstring(fields[2], dtype=np.float64, sep=',') if len(fields) > 2 else np.empty(0)
         return self.ChannelRecordingData(numbers, 1000 / self._sample_rate, recsrc)
     
     async def read_recorded_data(self) -> List[ChannelRecordingData]:
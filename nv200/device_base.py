@@ -7,7 +7,10 @@ from NV200 devices over supported transport protocols (e.g., serial, Telnet).
 
 import asyncio
 import logging
-from typing import Dict, Type, List, TypeVar, Union
+import re
+from contextvars import ContextVar
+from typing import Dict, Iterable, Mapping, Optional, Type, List, TypeVar, Union
+from types import MappingProxyType
 from nv200.transport_protocol import TransportProtocol
 from nv200._internal._reentrant_lock import _ReentrantAsyncLock
 from nv200.shared_types import (
@@ -20,6 +23,89 @@ from nv200.shared_types import (
 # Global module locker
 logger = logging.getLogger(__name__)
 
+_CONTROL_CHARS_TABLE = str.maketrans('', '', "\x01\r\n\x00")  # Deletes control chars from responses
+_ERROR_RESPONSE_RE = re.compile(r'error,\s*(\d+)\s*$')  # error,<code> response
+_RESPONSE_RE = re.compile(r'\s*([^,]*?)\s*(?:,(.*))?$')  # <command>[,<params>] response
+
+
+class CommandBatch:
+    """
+    Collects setter commands of a device and sends them with a single transport write.
+
+    Use `PiezoDeviceBase.batch` to create a batch. While the batch is active, all values
+    written by the current task via `PiezoDeviceBase.write_value` (this includes most device
+    setters) and all commands sent without waiting for a reply (`write_no_reply`, `write_batch`
+    with ``wait_for_reply=False``, i.e. the move commands) are queued instead of being sent.
+    The queued commands are flushed as one burst without waiting for replies when the
+    ``async with`` block exits without an exception. If an exception is raised, the queued
+    commands are discarded.
+
+    Note:
+        Writes that wait for a reply flush the queued commands first, so the command order
+        is kept. Reads inside the batch are sent immediately, so they do not observe the
+        queued writes.
+
+    Example:
+        >>> async with device.batch():
+        ...     await device.pid.set_mode(PidLoopMode.CLOSED_LOOP)
+        ...     await device.set_modulation_source(ModulationSource.SET_CMD)
+        ...     await device.set_setpoint(80)
+    """
+    def __init__(self, device: "PiezoDeviceBase"):
+        self._device = device
+        self._cmds: List[str] = []
+        self._token = None
+
+    @property
+    def device(self) -> "PiezoDeviceBase":
+        """
+        Returns the device the batch belongs to.
+        """
+        return self._device
+
+    def add(self, cmd: str, value: Union[int, float, str]):
+        """
+        Queues a ``cmd,value`` command for the next flush.
+        """
+        self.extend([f"{cmd},{value}"])
+
+    def extend(self, cmds: List[str]):
+        """
+        Queues the given command strings for the next flush. The cached values of the
+        commands are invalidated immediately, so that cache checks inside the batch do
+        not skip commands that have to be sent after the queued ones.
+        """
+        for cmd in cmds:
+            self._device._invalidate_cached_value(cmd)
+        self._cmds.extend(cmds)
+
+    async def flush(self):
+        """
+        Sends all queued commands with a single transport write. The device does not
+        acknowledge the commands, so the written values are not cached.
+        """
+        cmds, self._cmds = self._cmds, []
+        if not cmds:
+            return
+        logger.debug("Flushing batch: %s", cmds)
+        await self._device._write_frames_no_reply(cmds)
+
+    async def __aenter__(self) -> "CommandBatch":
+        self._token = _active_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        _active_batch.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            await self.flush()
+        else:
+            self._cmds.clear()
+
+
+# The batch that is active in the current task - context variables keep batches of concurrent tasks separate
+_active_batch: ContextVar[Optional[CommandBatch]] = ContextVar("_active_batch", default=None)
+
 class PiezoDeviceBase:
     """
     Generic piezosystem device base class.
@@ -56,12 +142,13 @@ class PiezoDeviceBase:
     CACHEABLE_COMMANDS: set[str] = set() # set of commands that can be cached
     DEFAULT_TIMEOUT_SECS = 0.6
     DEVICE_ID = None # Placeholder for device ID, to be set in subclasses
-    _help_dict: dict[str, str] = {}  # Dictionary to store help information for commands
+    _help_dict: Mapping[str, str] = MappingProxyType({})  # Read-only mapping with help information for commands
     
     def __init__(self, transport: TransportProtocol):
         self._transport : TransportProtocol = transport
         self._lock = _ReentrantAsyncLock()
         self._cache: Dict[str, str] = {}
+        self._discard_pending_input = True  # Flush stale input once before the first write
         self.frame_delimiter_write : str= "\r\n"  # Default frame delimiter for writing commands
 
     def __init_subclass__(cls, **kwargs):
@@ -88,8 +175,27 @@ class PiezoDeviceBase:
     async def _read_raw_message(self, timeout_param : float = DEFAULT_TIMEOUT_SECS) -> str:
         """
         Asynchronously reads a response from the transport layer with a specified timeout.
+        If no complete response is read, the input is flushed before the next write because
+        a late response may still arrive.
+        """
+        try:
+            return await self._transport.read_message(timeout_param)
+        except BaseException:
+            self._discard_pending_input = True
+            raise
+
+
+    async def _write_frame(self, data: str):
         """
-        return await self._transport.read_message(timeout_param)
+        Writes the given data to the transport layer. Pending input is only flushed if an
+        unread response may be left in the input buffer - responses are delimited by the
+        XON framing, so a flush before every write is not required. Every code path that
+        may leave a response unread must set ``_discard_pending_input``.
+        """
+        if self._discard_pending_input:
+            self._discard_pending_input = False
+            await self._transport.flush_input()
+        await self._transport.write(data)
         
 
     def _parse_response(self, response: str) -> tuple[str, List[str]]:
@@ -105,26 +211,26 @@ class PiezoDeviceBase:
         Raises:
             DeviceError: If the response indicates an error.
         """
+        # Remove all control characters in a single pass before parsing
+        response = response.translate(_CONTROL_CHARS_TABLE)
+
         # Check if the response indicates an error
         if response.startswith("error"):
-            parts = response.split(',', 1)
-            if len(parts) > 1:
+            match = _ERROR_RESPONSE_RE.match(response)
+            if match:
                 try:
-                    error_code = int(parts[1].strip("\x01\n\r\x00"))
                     # Raise a DeviceError with the error code
-                    raise DeviceError(ErrorCode.from_value(error_code))
+                    error = DeviceError(ErrorCode.from_value(int(match.group(1))))
                 except ValueError:
                     # In case the error code isn't valid
-                    raise DeviceError(1)  # Default error: Error not specified
+                    error = DeviceError(1)  # Default error: Error not specified
+                raise error
             else:
                 raise DeviceError(1)  # Default error: Error not specified
         else:
-            # Normal response, split the command and parameters
-            parts = response.split(',', 1)
-            command = parts[0].strip()
-            parameters = []
-            if len(parts) > 1:
-                parameters = [param.strip("\x01\n\r\x00") for param in parts[1].split(',')]
+            # Normal response, split the command and parameters in a single pass
+            command, params = _RESPONSE_RE.match(response).groups()
+            parameters = params.split(',') if params is not None else []
             return command, parameters
         
 
@@ -169,23 +275,269 @@ class PiezoDeviceBase:
             >>> await device_client.write('set,80') 
         """
         logger.debug("Writing cmd.: %s", cmd)
+        await self._flush_active_batch()
+        self._invalidate_cached_value(cmd)
 
         async with self.lock:
-            await self._transport.write(cmd + self.frame_delimiter_write)
+            await self._write_frame(cmd + self.frame_delimiter_write)
             try:
-                response = await self._transport.read_message(timeout=0.4)
-                return self._parse_response(response)
+                response = await self._read_raw_message(0.4)
             except asyncio.TimeoutError:
                 return None  # Or handle it differently
+            try:
+                return self._parse_response(response)
+            except Exception:
+                # The error response may belong to an earlier command that was sent without
+                # waiting for a reply - the response of this command may still follow
+                self._discard_pending_input = True
+                raise
+            
+
+    async def write_no_reply(self, cmd: str):
+        """
+        Sends a command to the transport layer without waiting for a response.
+
+        Use this for setter commands that do not produce a reply to avoid waiting
+        for the response timeout. Any unexpected response (e.g. an error message) is
+        discarded by the input flush before the next transport write. If a `CommandBatch`
+        of this device is active in the current task, the command is queued in the batch.
+
+        Args:
+            cmd (str): The command string to be sent. No carriage return is needed.
+
+        Example:
+            >>> await device_client.write_no_reply('set,80')
+        """
+        batch = self._current_batch()
+        if batch is not None:
+            logger.debug("Queuing cmd. in batch: %s", cmd)
+            batch.extend([cmd])
+            return
+
+        logger.debug("Writing cmd. (no reply): %s", cmd)
+        await self._write_frames_no_reply([cmd])
+
+
+    async def _write_frames_no_reply(self, cmds: List[str]):
+        """
+        Sends the given commands with a single transport write without waiting for a response.
+        Any response is discarded by the input flush before the next transport write.
+        """
+        for cmd in cmds:
+            self._invalidate_cached_value(cmd)
+
+        async with self.lock:
+            await self._write_frame(self.frame_delimiter_write.join(cmds) + self.frame_delimiter_write)
+            self._discard_pending_input = True
+
+
+    def _current_batch(self) -> Optional[CommandBatch]:
+        """
+        Returns the `CommandBatch` of this device that is active in the current task, if any.
+        """
+        batch = _active_batch.get()
+        return batch if batch is not None and batch.device is self else None
+
+
+    async def _flush_active_batch(self):
+        """
+        Sends the commands queued in the active `CommandBatch` of this device, so that
+        a command that is sent immediately does not overtake them.
+        """
+        batch = self._current_batch()
+        if batch is not None:
+            await batch.flush()
+
+
+    async def write_batch(self, cmds: List[str], wait_for_reply: bool = True) -> List[tuple[str, List[str]]]:
+        """
+        Sends multiple commands to the device with a single transport write.
+
+        All commands are joined with the write frame delimiter and sent at once. Afterwards
+        the responses are drained in one pass. Reading stops at the first timeout, so commands
+        that do not produce a response cost only a single timeout for the whole batch instead
+        of one timeout per command.
+
+        Args:
+            cmds (List[str]): The command strings to be sent. No carriage return is needed.
+            wait_for_reply (bool): If False, the commands are sent without draining any response.
+                If a `CommandBatch` of this device is active in the current task, the commands
+                are queued in the batch. Otherwise the queued commands are flushed first.
+
+        Returns:
+            List[tuple[str, List[str]]]: The parsed responses received for the batch.
+
+        Example:
+            >>> await device_client.write_batch(['cl,1', 'set,80'])
+        """
+        if not cmds:
+            return []
+        if not wait_for_reply:
+            batch = self._current_batch()
+            if batch is not None:
+                logger.debug("Queuing batch: %s", cmds)
+                batch.extend(cmds)
+            else:
+                logger.debug("Writing batch (no reply): %s", cmds)
+                await self._write_frames_no_reply(cmds)
+            return []
+
+        logger.debug("Writing batch: %s", cmds)
+        await self._flush_active_batch()
+        for cmd in cmds:
+            self._invalidate_cached_value(cmd)
+
+        async with self.lock:
+            await self._write_frame(self.frame_delimiter_write.join(cmds) + self.frame_delimiter_write)
+            responses = []
+            try:
+                for _ in cmds:
+                    try:
+                        response = await self._read_raw_message(0.4)
+                    except asyncio.TimeoutError:
+                        break
+                    responses.append(self._parse_response(response))
+            except BaseException:
+                # i.e. an error response - discard the remaining responses of the batch
+                self._discard_pending_input = True
+                raise
+            return responses
+
+
+    async def read_multi(self, cmds: List[str], timeout : float = DEFAULT_TIMEOUT_SECS) -> List[tuple[str, List[str]]]:
+        """
+        Sends multiple getter commands with a single transport write and reads back all responses.
+
+        This saves the round-trip per command compared to issuing the commands one after another.
+        Each command must produce exactly one response. If a response cannot be read or parsed,
+        the remaining responses are discarded before the next write, so that later reads are not
+        shifted by one response.
+
+        Args:
+            cmds (List[str]): The command strings to be sent.
+            timeout (float, optional): The timeout for reading each response in seconds.
+
+        Returns:
+            List[tuple[str, List[str]]]: The parsed responses in the order of the given commands.
+
+        Example:
+            >>> responses = await device_client.read_multi(['meas', 'temp'])
+            >>> print(responses)
+            [('meas', ['80.000']), ('temp', ['28.125'])]
+        """
+        logger.debug("Reading multiple values: %s", cmds)
+
+        async with self.lock:
+            await self._write_frame(self.frame_delimiter_write.join(cmds) + self.frame_delimiter_write)
+            try:
+                return [self._parse_response(await self._read_raw_message(timeout)) for _ in cmds]
+            except BaseException:
+                self._discard_pending_input = True
+                raise
+
+
+    async def write_batch_and_read(self, cmds: List[str], query: str, timeout : float = DEFAULT_TIMEOUT_SECS) -> tuple[str, List[str]]:
+        """
+        Sends setter commands that only reply on errors, followed by a getter command, with a
+        single transport write and returns the parsed response of the getter.
+
+        The responses are read until the getter response arrives, so an error response of a
+        setter is not taken as the response of the getter. If a setter returned an error, the
+        first error is raised after the getter response has been read, so that no response is
+        left in the input buffer.
+
+        Args:
+            cmds (List[str]): The setter command strings to be sent.
+            query (str): The getter command that is sent after the setters.
+            timeout (float, optional): The timeout for reading each response in seconds.
+
+        Returns:
+            tuple[str, List[str]]: The parsed response of the getter command.
+
+        Raises:
+            DeviceError: If a setter or the getter returned an error.
+
+        Example:
+            >>> await device_client.write_batch_and_read(['gbarb,0,10', 'gbarb,1,20'], 'gbarb,1')
+            ('gbarb', ['1', '20.000'])
+        """
+        logger.debug("Writing batch with query %s: %s", query, cmds)
+        await self._flush_active_batch()
+        for cmd in cmds:
+            self._invalidate_cached_value(cmd)
+
+        async with self.lock:
+            await self._write_frame(self.frame_delimiter_write.join([*cmds, query]) + self.frame_delimiter_write)
+            error: Optional[DeviceError] = None
+            try:
+                # Each setter produces at most one (error) response, the getter always responds
+                for _ in range(len(cmds) + 1):
+                    try:
+                        response = self._parse_response(await self._read_raw_message(timeout))
+                    except DeviceError as e:
+                        error = error or e
+                        continue
+                    if error is not None:
+                        raise error
+                    return response
+            except BaseException:
+                self._discard_pending_input = True
+                raise
+            raise error  # All responses were errors - the getter failed too
+
+
+    def _invalidate_cached_value(self, cmd: str):
+        """
+        Removes the cached value of a command if the given command string writes a new value
+        (i.e. ``cl,1``), so that the next read fetches the value from the device again.
+        """
+        name, sep, _ = cmd.partition(',')
+        if sep:
+            self._cache.pop(name.strip(), None)
+
+
+    def batch(self) -> CommandBatch:
+        """
+        Returns a `CommandBatch` context manager that collects all values written via
+        `write_value` in the current task and sends them with a single transport write.
+
+        Example:
+            >>> async with device.batch():
+            ...     await device.write_value('cl', 1)
+            ...     await device.write_value('set', 80)
+        """
+        return CommandBatch(self)
+
+
+    def _is_cached_value(self, cmd: str, value: Union[int, float, str]) -> bool:
+        """
+        Returns True if the command cache holds the given value for the command.
+        """
+        return self.CMD_CACHE_ENABLED and self._cache.get(cmd) == str(value)
+
+
+    def _cache_written_value(self, cmd: str, value: Union[int, float, str]):
+        """
+        Stores a value written to the device in the command cache if the command is cacheable.
+        """
+        if self.CMD_CACHE_ENABLED and cmd in self.CACHEABLE_COMMANDS:
+            logger.debug("Caching write value: %s,%s", cmd, value)
+            self._cache[cmd] = str(value)
         
 
-    async def write_value(self, cmd: str, value: Union[int, float, str, bool]):
+    async def write_value(self, cmd: str, value: Union[int, float, str, bool], wait_for_reply: bool = True):
         """
         Asynchronously writes a value to the device using the specified command.
 
         Args:
             cmd (str): The command string to send to the device.
             value (Union[int, float, str, bool]): The value to write, which can be an integer, float, string, or boolean.
+            wait_for_reply (bool): If False, the command is sent with `write_no_reply` and
+                no response is awaited. The value is not cached in this case because the
+                device did not acknowledge it.
+
+        If a `CommandBatch` of this device is active in the current task, the value is
+        queued in the batch instead of being sent.
 
         Example:
             >>> await device_client.write('set', 80)
@@ -197,15 +549,46 @@ class PiezoDeviceBase:
         else:
             value_to_write = value
 
+        batch = self._current_batch()
+        if batch is not None:
+            logger.debug("Queuing value in batch: %s,%s", cmd, value_to_write)
+            batch.add(cmd, value_to_write)
+            return
+
         # Always use %f for logging value
         logger.debug("Writing value: %s,%s", cmd, value_to_write)
-        await self.write(f"{cmd},{value_to_write}")
-
-        if self.CMD_CACHE_ENABLED and cmd in self.CACHEABLE_COMMANDS:
-            logger.debug("Caching write value: %s,%f", cmd, float(value_to_write))
-            self._cache[cmd] = str(value_to_write)
+        if wait_for_reply:
+            await self.write(f"{cmd},{value_to_write}")
+            self._cache_written_value(cmd, value_to_write)
+        else:
+            await self.write_no_reply(f"{cmd},{value_to_write}")
         
        
+    async def write_values(self, cmd: str, values: Iterable[Union[int, float]], wait_for_reply: bool = False):
+        """
+        Asynchronously writes a sequence of values for the same command to the device.
+
+        All ``cmd,value`` frames are formatted up front and sent with a single transport
+        write using `write_batch` instead of one write per value. This is useful for
+        streaming setpoint sequences, i.e. scripted position sweeps.
+
+        Args:
+            cmd (str): The command string to send to the device.
+            values (Iterable[Union[int, float]]): The values to write in the given order.
+            wait_for_reply (bool): If True, the responses of the batch are drained and the
+                last value is cached.
+
+        Example:
+            >>> await device_client.write_values('set', [10, 20, 30])
+        """
+        frames = [f"{cmd},{int(value) if isinstance(value, bool) else value}" for value in values]
+        if not frames:
+            return
+        await self.write_batch(frames, wait_for_reply)
+        if wait_for_reply:
+            self._cache_written_value(cmd, frames[-1].split(',', 1)[1])
+
+
     async def write_string_value(self, cmd: str, value: str):
         """
         Sends a command with a string value to the transport layer.
@@ -243,8 +626,13 @@ class PiezoDeviceBase:
             b'cl,1\\r\\n'
         """
         async with self.lock:
-            await self._transport.write(cmd + self.frame_delimiter_write)
-            return await self._read_raw_message(timeout)
+            await self._write_frame(cmd + self.frame_delimiter_write)
+            response = await self._read_raw_message(timeout)
+            if response.translate(_CONTROL_CHARS_TABLE).startswith("error"):
+                # The error response may belong to an earlier command that was sent without
+                # waiting for a reply - the response of this command may still follow
+                self._discard_pending_input = True
+            return response
           
 
     async def read_stripped_response_string(self, cmd: str, timeout : float = DEFAULT_TIMEOUT_SECS) -> str:
@@ -375,6 +763,48 @@ class PiezoDeviceBase:
         return value
 
 
+    async def read_string_values(self, cmds: List[str]) -> List[str]:
+        """
+        Asynchronously reads the first value of multiple commands from the device.
+        Cached values are returned without device access and all remaining commands
+        are queried with a single transport write using `read_multi`.
+
+        Args:
+            cmds (List[str]): The command strings to be sent.
+
+        Returns:
+            List[str]: The values as strings in the order of the given commands.
+
+        Example:
+            >>> await self.read_string_values(['desc', 'acserno'])
+            ['TRITOR100SG', '85533']
+        """
+        values: Dict[str, str] = {}
+        if self.CMD_CACHE_ENABLED:
+            values = {cmd: self._cache[cmd] for cmd in cmds if cmd in self._cache}
+        missing = [cmd for cmd in cmds if cmd not in values]
+        if missing:
+            logger.debug("Reading string values for commands: %s", missing)
+            for cmd, (_, params) in zip(missing, await self.read_multi(missing)):
+                value = params[0].rstrip()
+                values[cmd] = value
+                if self.CMD_CACHE_ENABLED and cmd in self.CACHEABLE_COMMANDS:
+                    self._cache[cmd] = value
+        return [values[cmd] for cmd in cmds]
+
+
+    async def read_float_values(self, cmds: List[str]) -> List[float]:
+        """
+        Asynchronously reads the first value of multiple commands from the device as float values.
+        See `read_string_values` for details.
+
+        Example:
+            >>> await device_client.read_float_values(['posmin', 'posmax'])
+            [0.0, 100.0]
+        """
+        return [float(value) for value in await self.read_string_values(cmds)]
+
+
     async def read_float_value(self, cmd: str, param_index : int = 0) -> float:
         """
         Asynchronously reads a single float value from device.
@@ -509,9 +939,9 @@ class PiezoDeviceBase:
             return cls._help_dict.get(cmd, f"No help available for command '{cmd}'.")
         
     @classmethod
-    def help_dict(cls):
+    def help_dict(cls) -> Mapping[str, str]:
         """
-        Returns the class-level help dictionary with a list of all commands and their descriptions.
+        Returns the class-level read-only help mapping with a list of all commands and their descriptions.
         """
         return cls._help_dict
     
@@ -534,21 +964,20 @@ class PiezoDeviceBase:
             >>>     "modsrc", "notchon", "sr", "poslpon", "setlpon", "cl", "reclen", "recstr"]
             >>> await self.backup_settings(backup_list)
         """
-        backup : Dict[str, str] = {}
-        for cmd in backup_list:
-            response = await self.read_response_parameters_string(cmd)
-            backup[cmd] = response
-        return backup
+        # Query all parameters with a single transport write instead of one round-trip per command
+        responses = await self.read_multi(backup_list)
+        return {cmd: ",".join(params) for cmd, (_, params) in zip(backup_list, responses)}
     
 
     async def restore_parameters(self, backup: Dict[str, str]):
         """
         Asynchronously restores device parameters from a backup created with `backup_parameters`.
 
-        Iterates over the provided backup dictionary, writing each parameter value to the device.
+        All parameter values are sent to the device as one batch with a single transport write.
         """
+        await self.write_batch([f"{cmd},{value}" for cmd, value in backup.items()])
         for cmd, value in backup.items():
-            await self.write_value(cmd, value)
+            self._cache_written_value(cmd, value)
     
 
 PiezoDeviceType = TypeVar("PiezoDeviceType", bound=PiezoDeviceBase)
@@ -8,7 +8,9 @@ or serial port), and optionally a MAC address.
 
 import asyncio
 import logging
-from typing import List, Type, Optional
+import time
+from dataclasses import replace
+from typing import Dict, List, Type, Optional, Tuple
 from nv200.device_factory import create_device_from_id
 from nv200.transport_protocol import TransportProtocol
 from nv200.telnet_protocol import TelnetProtocol  
@@ -21,12 +23,63 @@ from nv200.transport_factory import transport_from_detected_device
 # Global module locker
 logger = logging.getLogger(__name__)
 
+DISCOVERY_CACHE_TTL_S = 5.0  # Lifetime of cached discovery results in seconds
+DISCOVERY_TIMEOUT_S = 10.0  # Maximum time to wait for the interface scans in seconds
+MAX_CONCURRENT_ENRICH = 10  # Maximum number of devices queried in parallel for detailed device info
+
+# Cached discovery results keyed by the discovery flags: (timestamp, devices)
+_discovery_cache: Dict[DiscoverFlags, Tuple[float, List[DetectedDevice]]] = {}
+# Running interface scans keyed by the discovery flags - concurrent callers share a running scan
+_discovery_scans: Dict[DiscoverFlags, asyncio.Task] = {}
+
+
+def invalidate_discovery_cache() -> None:
+    """
+    Clears all cached discovery results.
+
+    Call this function if the set of connected devices has changed (e.g. after a device
+    reset or a change of its network configuration) to ensure that the next call of
+    :func:`discover_devices` performs a full scan of all interfaces.
+    """
+    _discovery_cache.clear()
+    _discovery_scans.clear()  # Results of running scans are not cached anymore
+    logger.debug("Discovery cache cleared.")
+
+
+def _copy_devices(devices: List[DetectedDevice]) -> List[DetectedDevice]:
+    """
+    Returns copies of the given devices, so that callers cannot modify cached results.
+    """
+    return [replace(d, device_info=dict(d.device_info)) for d in devices]
+
+
+def _start_discovery_scan(flags: DiscoverFlags, max_concurrent_enrich: int) -> asyncio.Task:
+    """
+    Starts an interface scan for the given flags that can be awaited by multiple callers.
+    The result is stored in the discovery cache, unless the scan has been superseded by
+    a newer scan or the cache has been invalidated in the meantime.
+    """
+    task = asyncio.create_task(_discover_devices_uncached(flags, max_concurrent_enrich))
+    _discovery_scans[flags] = task
+
+    def on_done(t: asyncio.Task):
+        if _discovery_scans.get(flags) is not t:
+            return
+        del _discovery_scans[flags]
+        if not t.cancelled() and t.exception() is None:
+            _discovery_cache[flags] = (time.monotonic(), t.result())
+
+    task.add_done_callback(on_done)
+    return task
+
 
 
 async def _enrich_device_info(detected_device: DetectedDevice, flags: DiscoverFlags) -> DetectedDevice:
     """
     Asynchronously enriches a DetectedDevice object with additional actuator information.
 
+    A single connection is opened per device and reused for all queries before it is closed.
+
     Returns:
         DetectedDevice: The enriched device information object with actuator name and serial number populated.
     """
@@ -45,7 +98,56 @@ async def _enrich_device_info(detected_device: DetectedDevice, flags: DiscoverFl
         return None
       
 
-async def discover_devices(flags: DiscoverFlags = DiscoverFlags.ALL_INTERFACES, device_class: Optional[Type[PiezoDeviceBase]] = None) -> List[DetectedDevice]:
+async def _discover_devices_uncached(flags: DiscoverFlags, max_concurrent_enrich: int) -> List[DetectedDevice]:
+    """
+    Scans all interfaces selected by the given flags without consulting the discovery cache.
+    """
+    devices: List[DetectedDevice] = []
+    tasks: List[asyncio.Task] = []
+
+    if flags & DiscoverFlags.DETECT_ETHERNET:
+        tasks.append(asyncio.create_task(TelnetProtocol.discover_devices(flags)))
+
+    if flags & DiscoverFlags.DETECT_SERIAL:
+        tasks.append(asyncio.create_task(SerialProtocol.discover_devices(flags)))
+
+    if not tasks:
+        return devices
+
+    # Do not let a hanging interface scan block the results of the other interface
+    done, pending = await asyncio.wait(tasks, timeout=DISCOVERY_TIMEOUT_S)
+    if pending:
+        logger.warning("Device discovery timed out after %.1f s - returning partial results", DISCOVERY_TIMEOUT_S)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in tasks:
+        if task in done:
+            devices.extend(task.result())
+
+    if flags & DiscoverFlags.READ_DEVICE_INFO:
+        # Enrich each device with detailed info
+        logger.debug("Enriching %d devices with detailed info...", len(devices))
+        # Limit the number of simultaneously opened connections to avoid socket exhaustion
+        sem = asyncio.Semaphore(max_concurrent_enrich)
+
+        async def _guarded(d: DetectedDevice) -> DetectedDevice:
+            async with sem:
+                return await _enrich_device_info(d, flags)
+
+        raw_results = await asyncio.gather(*(_guarded(d) for d in devices))
+        devices = [d for d in raw_results if d is not None]
+
+    return devices
+
+
+async def discover_devices(
+    flags: DiscoverFlags = DiscoverFlags.ALL_INTERFACES,
+    device_class: Optional[Type[PiezoDeviceBase]] = None,
+    force: bool = False,
+    max_concurrent_enrich: int = MAX_CONCURRENT_ENRICH
+) -> List[DetectedDevice]:
     """
     Asynchronously discovers devices on available interfaces based on the specified discovery flags and optional device class.
 
@@ -58,6 +160,9 @@ async def discover_devices(flags: DiscoverFlags = DiscoverFlags.ALL_INTERFACES,
     Args:
         flags (DiscoverFlags, optional): Flags indicating which interfaces to scan and whether to read device info. Defaults to DiscoverFlags.ALL_INTERFACES.
         device_class (Optional[Type[PiezoDeviceBase]], optional): If specified, only devices matching this class will be returned. Also ensures device info is read.
+        force (bool, optional): If True, the discovery cache is bypassed and a full scan is performed. Defaults to False.
+        max_concurrent_enrich (int, optional): Maximum number of devices that are connected in parallel to read
+            the device info. Defaults to ``MAX_CONCURRENT_ENRICH``.
 
     Returns:
         List[DetectedDevice]: A list of detected devices, optionally enriched with detailed information and filtered by device class.
@@ -69,6 +174,11 @@ async def discover_devices(flags: DiscoverFlags = DiscoverFlags.ALL_INTERFACES,
         - Device discovery is performed in parallel for supported interfaces (Ethernet, Serial).
         - If READ_DEVICE_INFO is set, each detected device is enriched with additional information.
         - If device_class is specified, only devices matching the class's DEVICE_ID are returned.
+        - Results are cached for ``DISCOVERY_CACHE_TTL_S`` seconds per set of flags. Repeated calls
+          within this time window return the cached result. Use ``force=True`` or
+          :func:`invalidate_discovery_cache` to enforce a new scan.
+        - Concurrent calls with the same flags share a running scan. Each caller receives its own
+          copies of the detected devices.
 
     Examples:
         Discover all Devices on all interfaces
@@ -80,35 +190,22 @@ async def discover_devices(flags: DiscoverFlags = DiscoverFlags.ALL_INTERFACES,
         >>> device = await nv200.device_discovery.discover_devices(DiscoverFlags.DETECT_SERIAL | DiscoverFlags.READ_DEVICE_INFO, NV200Device)
     """
 
-    devices: List[DetectedDevice] = []
-    tasks = []
-
     if device_class:
         flags |= DiscoverFlags.READ_DEVICE_INFO  # Ensure we read device info if a specific class is requested
 
-    if flags & DiscoverFlags.DETECT_ETHERNET:
-        tasks.append(TelnetProtocol.discover_devices(flags))
+    cached = _discovery_cache.get(flags)
+    if not force and cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL_S:
+        logger.debug("Using cached discovery result for flags %s", flags)
+        devices = cached[1]
     else:
-        tasks.append(asyncio.sleep(0, result=[]))  # Placeholder for parallel await
-
-    if flags & DiscoverFlags.DETECT_SERIAL:
-        tasks.append(SerialProtocol.discover_devices(flags))
-    else:
-        tasks.append(asyncio.sleep(0, result=[]))  # Placeholder for parallel await
-
-    eth_devs, serial_devs = await asyncio.gather(*tasks)
-
-    if flags & DiscoverFlags.DETECT_ETHERNET:
-        devices.extend(eth_devs)
-
-    if flags & DiscoverFlags.DETECT_SERIAL:
-        devices.extend(serial_devs)
-
-    if flags & DiscoverFlags.READ_DEVICE_INFO:
-        # Enrich each device with detailed info
-        logger.debug("Enriching %d devices with detailed info...", len(devices))
-        raw_results = await asyncio.gather(*(_enrich_device_info(d, flags) for d in devices))
-        devices = [d for d in raw_results if d is not None]
+        scan = None if force else _discovery_scans.get(flags)
+        if scan is None or scan.get_loop() is not asyncio.get_running_loop():
+            scan = _start_discovery_scan(flags, max_concurrent_enrich)
+        else:
+            logger.debug("Waiting for running discovery scan for flags %s", flags)
+        # Shield the shared scan, so that a cancelled caller does not cancel it for the other callers
+        devices = await asyncio.shield(scan)
+    devices = _copy_devices(devices)
 
     if device_class:
         # Filter devices by the specified device class
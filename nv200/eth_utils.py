@@ -1,7 +1,13 @@
 import socket
+import time
 import psutil
 import ipaddress
 import re
+from functools import lru_cache
+from typing import List, Tuple
+
+
+ACTIVE_IPS_CACHE_TTL_S = 2  # Lifetime of the cached active interface list in seconds
 
 
 def is_valid_ip(address: str) -> bool:
@@ -54,3 +60,24 @@ def get_active_ethernet_ips():
                     active_ethernet_ips.append((interface, addr.address))
     
     return active_ethernet_ips
+
+
+@lru_cache(maxsize=1)
+def _active_ethernet_ips_snapshot(time_bucket: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Returns an immutable snapshot of the active interfaces - cached per time bucket.
+    """
+    return tuple(get_active_ethernet_ips())
+
+
+def get_active_ethernet_ips_cached() -> List[Tuple[str, str]]:
+    """
+    Same as :func:`get_active_ethernet_ips`, but the result is cached for
+    ``ACTIVE_IPS_CACHE_TTL_S`` seconds to avoid repeated enumeration of the
+    network interfaces when devices are discovered periodically.
+
+    Returns:
+        list of tuple: A list of tuples where each tuple contains the interface name (str)
+        and its corresponding IPv4 address (str).
+    """
+    return list(_active_ethernet_ips_snapshot(int(time.monotonic()) // ACTIVE_IPS_CACHE_TTL_S))
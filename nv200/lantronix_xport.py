@@ -1,22 +1,56 @@
 import asyncio
+import errno
 import socket
+import time
 import telnetlib3
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from enum import Enum, IntFlag
-from typing import List, Tuple, Dict, Optional
-from nv200.eth_utils import get_active_ethernet_ips
+from typing import List, Tuple, Dict, Optional, Union
+from nv200.eth_utils import get_active_ethernet_ips_cached
 from nv200.shared_types import NetworkEndpoint
 
 # Define constants
 BROADCAST_IP = '255.255.255.255'
 UDP_PORT = 30718  # Lantronix Discovery Protocol port
 TELNET_PORT = 23  # Telnet Port (default: 23)
+DISCOVERY_PACKET = b"\x00\x00\x00\xF6"  # Lantronix Discovery Protocol query packet
+BROADCAST_ADDRESS = (BROADCAST_IP, UDP_PORT)  # Destination address of the discovery packet
 TIMEOUT = 0.4  # Timeout for UDP response
+UDP_SOCKET_RCVBUF_SIZE = 500_000  # Kernel receive buffer size of the discovery sockets in bytes
+UDP_RECV_BUFFER_SIZE = 64  # Receive buffer size - Lantronix replies are LANTRONIX_RESPONSE_SIZE (30) bytes
+MSG_SIZE_ERRNOS = (errno.EMSGSIZE, 10040)  # Datagram larger than receive buffer (POSIX / Windows WSAEMSGSIZE)
+MIN_IDLE_TIMEOUT = TIMEOUT / 2  # Minimum time to wait for further responses after the last response
 
 # Global module locker
 logger = logging.getLogger(__name__)
 
 
+def _idle_timeout(max_response_gap: float) -> float:
+    """
+    Returns the time to wait for further responses after the last device response.
+
+    The idle window is twice the largest gap between the device responses of the current
+    discovery, but at least ``MIN_IDLE_TIMEOUT`` and at most ``TIMEOUT``. The window only
+    depends on the current discovery, so slow replies on one interface or in one call do
+    not shorten the window of other discoveries.
+    """
+    return min(TIMEOUT, max(MIN_IDLE_TIMEOUT, 2 * max_response_gap))
+
+
+def _create_udp_socket(local_ip: str) -> socket.socket:
+    """
+    Creates a UDP broadcast socket bound to the discovery port of the given local interface.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_SOCKET_RCVBUF_SIZE)
+    s.bind((local_ip, UDP_PORT))
+    return s
+
+
 class FlowControlMode(Enum):
     """
     Enumeration for different flow control options of XPORT device
@@ -36,11 +70,16 @@ class FlowControlMode(Enum):
 
 
 
-async def send_udp_broadcast_async(local_ip : str) -> List[Tuple[bytes, Tuple[str, int]]]:
+async def send_udp_broadcast_async(local_ip : str, target_mac: Optional[bytes] = None) -> List[Tuple[bytes, Tuple[str, int]]]:
     """
     Asynchronously sends a UDP broadcast to discover devices on the network. It sends a broadcast message
     and listens for responses within a specified timeout period.
 
+    Args:
+        local_ip (str): The IP address of the local interface used to send the broadcast.
+        target_mac (Optional[bytes]): The raw 6 byte MAC address of a device of interest. If given,
+            receiving stops as soon as this device has replied.
+
     Returns:
         List[Tuple[bytes, Tuple[str, int]]]:
             A list of tuples where each tuple contains:
@@ -48,12 +87,10 @@ async def send_udp_broadcast_async(local_ip : str) -> List[Tuple[bytes, Tuple[st
             - The sender's address, which is a tuple of IP (str) and port (int).
             An empty list is returned if no responses are received or if an error occurs.
     """
-    # Create a UDP socket
+    # Create a non-blocking UDP socket - it is closed after the discovery, so that no idle
+    # socket stays bound to the discovery port and swallows replies meant for other sockets
     loop = asyncio.get_event_loop()
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    s.bind((local_ip, UDP_PORT))
+    s = _create_udp_socket(local_ip)
     s.setblocking(False)  # Non-blocking mode
 
     # List to store responses
@@ -61,18 +98,57 @@ async def send_udp_broadcast_async(local_ip : str) -> List[Tuple[bytes, Tuple[st
 
     # Set up a UDP broadcast message
     try:
-        s.sendto(bytearray([0x00, 0x00, 0x00, 0xF6]), (BROADCAST_IP, UDP_PORT))  # Lantronix Discovery Packet
-
-        # Timeout for receiving responses
-        async def receive_response():
+        s.sendto(DISCOVERY_PACKET, BROADCAST_ADDRESS)
+        deadline = loop.time() + TIMEOUT
+        last_response_time: Optional[float] = None  # Arrival time of the last device response
+        max_response_gap = 0.0  # Largest gap between two device responses
+
+        def drain_pending(received_data: Tuple[bytes, Tuple[str, int]]) -> bool:
+            """
+            Stores the given response and all further responses that are already queued
+            in the socket without another event loop round-trip.
+            Returns True if the device of interest has replied.
+            """
+            nonlocal last_response_time, max_response_gap
             while True:
-                received_data = await loop.sock_recvfrom(s, 65565)
                 broadcast_responses.append(received_data)
-
-        # Use asyncio's event loop to wait for responses
-        await asyncio.wait_for(receive_response(), timeout=TIMEOUT)
-    except asyncio.TimeoutError:
-        pass
+                if len(received_data[0]) == LANTRONIX_RESPONSE_SIZE:
+                    now = loop.time()
+                    if last_response_time is not None:
+                        max_response_gap = max(max_response_gap, now - last_response_time)
+                    last_response_time = now
+                    if target_mac is not None and received_data[0].startswith(target_mac, LANTRONIX_MAC_OFFSET):
+                        return True
+                while True:
+                    try:
+                        received_data = s.recvfrom(UDP_RECV_BUFFER_SIZE)
+                        break
+                    except BlockingIOError:
+                        return False
+                    except OSError as e:
+                        if e.errno not in MSG_SIZE_ERRNOS:
+                            raise  # Oversized datagrams cannot be Lantronix replies and are skipped
+
+        # Receive responses until the timeout expires or no further device replies
+        # within the idle window after the last response
+        while True:
+            now = loop.time()
+            remaining = deadline - now
+            if last_response_time is not None:
+                remaining = min(remaining, last_response_time + _idle_timeout(max_response_gap) - now)
+            if remaining <= 0:
+                break
+            try:
+                async with asyncio.timeout(remaining):
+                    received_data = await loop.sock_recvfrom(s, UDP_RECV_BUFFER_SIZE)
+            except asyncio.TimeoutError:
+                break
+            except OSError as e:
+                if e.errno in MSG_SIZE_ERRNOS:
+                    continue  # Oversized datagram - cannot be a Lantronix reply
+                raise
+            if drain_pending(received_data):
+                break  # Device of interest found - no need to wait for further replies
     except (ValueError, IndexError) as e:
         logger.error("Error sending UDP broadcast: %s", e)
         broadcast_responses = []
@@ -82,13 +158,31 @@ async def send_udp_broadcast_async(local_ip : str) -> List[Tuple[bytes, Tuple[st
     return broadcast_responses
 
 
-def find_device_by_mac(device_list: List[NetworkEndpoint], target_mac: str) -> Optional[str]:
+def index_by_mac(device_list: List[NetworkEndpoint]) -> Dict[str, str]:
+    """
+    Builds a MAC address to IP address index of the discovered devices.
+
+    Use this if multiple MAC addresses are looked up in the same discovery result.
+
+    Args:
+        device_list (List[NetworkEndpoint]):
+            The discovered network endpoints.
+
+    Returns:
+        Dict[str, str]:
+            A dictionary mapping the MAC address of each device to its IP address.
+    """
+    return {dev.mac: dev.ip for dev in device_list}
+
+
+def find_device_by_mac(device_list: Union[List[NetworkEndpoint], Dict[str, str]], target_mac: str) -> Optional[str]:
     """
     Searches for a device by its MAC address in the list of discovered devices.
 
     Args:
-        devices (List[Dict[str, str]]):
-            A list of dictionaries, each containing the 'MAC' and 'IP' of a device.
+        device_list (Union[List[NetworkEndpoint], Dict[str, str]]):
+            The discovered network endpoints or a MAC to IP index created with :func:`index_by_mac`.
+            Lookups in an index take constant time.
         target_mac (str):
             The MAC address to search for.
 
@@ -96,17 +190,23 @@ def find_device_by_mac(device_list: List[NetworkEndpoint], target_mac: str) -> O
         Optional[str]:
             The IP address of the device if found, or None if the device is not found.
     """
+    if isinstance(device_list, dict):
+        return device_list.get(target_mac)
     for dev in device_list:
         if dev.mac == target_mac:
             return dev.ip
     return None
 
 
-async def discover_lantronix_devices_async() -> List[NetworkEndpoint]:
+async def discover_lantronix_devices_async(target_mac: Optional[bytes] = None) -> List[NetworkEndpoint]:
     """
     Discovers Lantronix devices on the network by sending UDP broadcast messages
     from all active Ethernet interfaces and parsing their responses.
 
+    Args:
+        target_mac (Optional[bytes]): The raw 6 byte MAC address of a device of interest. If given,
+            the discovery returns as soon as this device has replied on any interface.
+
     Returns:
         List[NetworkEndpoint]:
             A list of NetworkEndpoint instances, each containing:
@@ -114,22 +214,39 @@ async def discover_lantronix_devices_async() -> List[NetworkEndpoint]:
             - ip (str): The IP address of the responding device.
     """
     device_list: List[NetworkEndpoint] = []
-    ips = [ip for _, ip in get_active_ethernet_ips()]
+    ips = [ip for _, ip in get_active_ethernet_ips_cached()]
 
     async def discover_from_ip(ip: str) -> List[NetworkEndpoint]:
-        responses = await send_udp_broadcast_async(ip)
+        responses = await send_udp_broadcast_async(ip, target_mac)
         network_endpoints = parse_responses(responses)
         if network_endpoints:
             for endpoint in network_endpoints:
                 logger.info("Interface %s detected device: %s", ip, endpoint)
         return network_endpoints
 
-    # Launch all discovery coroutines in parallel
-    results = await asyncio.gather(*(discover_from_ip(ip) for ip in ips))
+    if target_mac is None:
+        # Launch all discovery coroutines in parallel
+        results = await asyncio.gather(*(discover_from_ip(ip) for ip in ips))
 
-    # Flatten list of lists
-    for r in results:
-        device_list.extend(r)
+        # Flatten list of lists
+        for r in results:
+            device_list.extend(r)
+
+        return device_list
+
+    # Stop the discovery on all other interfaces as soon as the target device is found
+    target_mac_str = _mac_from_bytes(target_mac)
+    tasks = [asyncio.create_task(discover_from_ip(ip)) for ip in ips]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            endpoints = await next_done
+            device_list.extend(endpoints)
+            if any(endpoint.mac == target_mac_str for endpoint in endpoints):
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     return device_list
 
@@ -151,10 +268,55 @@ async def discover_lantronix_device_async(target_mac: str) -> Optional[str]:
     Raises:
             ValueError: If the provided MAC address is invalid.
     """
-    devices = await discover_lantronix_devices_async()
+    target_mac_bytes = bytes.fromhex(target_mac.replace(':', ''))
+    if len(target_mac_bytes) != 6:
+        raise ValueError(f"Invalid MAC address: {target_mac}")
+    devices = await discover_lantronix_devices_async(target_mac_bytes)
     return find_device_by_mac(devices, target_mac)
 
 
+async def query_device_mac_async(ip: str, timeout: float = TIMEOUT) -> Optional[str]:
+    """
+    Sends the discovery query directly to the given IP address and returns the MAC address
+    of the Lantronix device that replies.
+
+    Use this to check that a previously known IP address still belongs to the same device,
+    i.e. after a DHCP address reassignment, without a network wide discovery.
+
+    Args:
+        ip (str): The IP address of the device.
+        timeout (float): The time to wait for the reply in seconds.
+
+    Returns:
+        Optional[str]:
+            The upper case, colon separated MAC address of the device, or None if no
+            Lantronix device replied within the timeout.
+    """
+    loop = asyncio.get_event_loop()
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    s.setblocking(False)  # Non-blocking mode
+    try:
+        s.sendto(DISCOVERY_PACKET, (ip, UDP_PORT))
+        async with asyncio.timeout(timeout):
+            while True:
+                try:
+                    data, address = await loop.sock_recvfrom(s, UDP_RECV_BUFFER_SIZE)
+                except OSError as e:
+                    if e.errno in MSG_SIZE_ERRNOS:
+                        continue  # Oversized datagram - cannot be a Lantronix reply
+                    raise
+                if address[0] != ip:
+                    continue
+                endpoints = parse_responses([(data, address)])
+                if endpoints:
+                    return endpoints[0].mac
+    except (asyncio.TimeoutError, OSError) as e:
+        logger.debug("No discovery reply from %s: %s", ip, e)
+        return None
+    finally:
+        s.close()
+
+
 def send_udp_broadcast(local_ip : str) -> List[Tuple[bytes, Tuple[str, int]]]:
     """
     Sends a UDP broadcast to discover devices on the network. It sends a broadcast message
@@ -167,23 +329,39 @@ def send_udp_broadcast(local_ip : str) -> List[Tuple[bytes, Tuple[str, int]]]:
             - The sender's address, which is a tuple of IP (str) and port (int).
             An empty list is returned if no responses are received or if an error occurs.
     """
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    s.bind((local_ip, UDP_PORT))
+    s = _create_udp_socket(local_ip)
     s.settimeout(TIMEOUT)
 
     try:
         # Send discovery packet (Lantronix Device Discovery Protocol)
-        s.sendto(bytearray([0x00, 0x00, 0x00, 0xF6]), (BROADCAST_IP, UDP_PORT))
+        s.sendto(DISCOVERY_PACKET, BROADCAST_ADDRESS)
+        deadline = time.monotonic() + TIMEOUT
+        last_response_time: Optional[float] = None  # Arrival time of the last device response
+        max_response_gap = 0.0  # Largest gap between two device responses
 
         broadcast_responses = []
         while True:
+            now = time.monotonic()
+            remaining = deadline - now
+            if last_response_time is not None:
+                remaining = min(remaining, last_response_time + _idle_timeout(max_response_gap) - now)
+            if remaining <= 0:
+                break
+            s.settimeout(remaining)
             try:
-                received_data = s.recvfrom(65565)  # Receive message (msg, (ip, port))
-                broadcast_responses.append(received_data)
+                received_data = s.recvfrom(UDP_RECV_BUFFER_SIZE)  # Receive message (msg, (ip, port))
             except socket.timeout:
                 break  # Exit loop when no more responses arrive
+            except OSError as e:
+                if e.errno in MSG_SIZE_ERRNOS:
+                    continue  # Oversized datagram - cannot be a Lantronix reply
+                raise
+            broadcast_responses.append(received_data)
+            if len(received_data[0]) == LANTRONIX_RESPONSE_SIZE:
+                now = time.monotonic()
+                if last_response_time is not None:
+                    max_response_gap = max(max_response_gap, now - last_response_time)
+                last_response_time = now
 
     except (ValueError, IndexError) as e:
         logger.error("Error sending UDP broadcast: %s", e)
@@ -205,14 +383,23 @@ def discover_lantronix_devices() -> List[NetworkEndpoint]:
             - mac (str): The MAC address of the responding device.
             - ip (str): The IP address of the responding device.
     """
-    for _, ip in get_active_ethernet_ips():
-        device_responses = send_udp_broadcast(ip)
-        if not device_responses:
-            continue
-        device_list = parse_responses(device_responses)
-        if device_list:
-            return device_list
-    return []
+    ips = [ip for _, ip in get_active_ethernet_ips_cached()]
+    if not ips:
+        return []
+
+    # Broadcast on all interfaces in parallel and return the first non-empty result. Leaving the
+    # executor waits for the remaining broadcasts (at most TIMEOUT), so that no worker thread keeps
+    # a socket bound to the discovery port that could receive the replies of a following discovery.
+    with ThreadPoolExecutor(max_workers=len(ips)) as executor:
+        futures = [executor.submit(send_udp_broadcast, ip) for ip in ips]
+        for future in as_completed(futures):
+            device_responses = future.result()
+            if not device_responses:
+                continue
+            device_list = parse_responses(device_responses)
+            if device_list:
+                return device_list
+        return []
 
 
 def discover_lantronix_device(target_mac: str) -> Optional[str]:
@@ -238,6 +425,17 @@ def discover_lantronix_device(target_mac: str) -> Optional[str]:
 
 LANTRONIX_RESPONSE_SIZE = 30  # Expected size of Lantronix response
 LAMNTONIX_MAC_PREFIX = "00:80:A3"  # Lantronix MAC address prefix
+LANTRONIX_MAC_PREFIX_BYTES = b"\x00\x80\xa3"  # Lantronix MAC address prefix as raw bytes
+LANTRONIX_MAC_OFFSET = 24  # Offset of the 6 MAC address bytes in the Lantronix response
+
+
+@lru_cache(maxsize=256)
+def _mac_from_bytes(mac_bytes: bytes) -> str:
+    """
+    Formats 6 raw MAC address bytes as upper case, colon separated MAC address string.
+    """
+    return "%02X:%02X:%02X:%02X:%02X:%02X" % tuple(mac_bytes)
+
 
 def parse_responses(response_list: List[Tuple[bytes, Tuple[str, int]]]) -> List[NetworkEndpoint]:
     """
@@ -256,15 +454,19 @@ def parse_responses(response_list: List[Tuple[bytes, Tuple[str, int]]]) -> List[
             - ip (str): The IP address of the responding device.
     """
     parsed_devices = []
+    seen_macs = set()  # Skip duplicate replies of the same device
     for data, address in response_list:
         try:
             if len(data) != LANTRONIX_RESPONSE_SIZE:
                 continue
-            mac_hex = data.hex()
-            mac_address = ':'.join(mac_hex[48:60][i:i + 2] for i in range(0, 12, 2)).upper()
-            if not mac_address.startswith(LAMNTONIX_MAC_PREFIX):
+            # Reject non-Lantronix responders on the raw bytes before anything is copied or formatted
+            if not data.startswith(LANTRONIX_MAC_PREFIX_BYTES, LANTRONIX_MAC_OFFSET):
+                continue
+            mac_bytes = bytes(data[LANTRONIX_MAC_OFFSET:LANTRONIX_MAC_OFFSET + 6])
+            if mac_bytes in seen_macs:
                 continue
-            parsed_devices.append(NetworkEndpoint(mac=mac_address, ip=address[0]))
+            seen_macs.add(mac_bytes)
+            parsed_devices.append(NetworkEndpoint(mac=_mac_from_bytes(mac_bytes), ip=address[0]))
         except Exception as e:
             logger.error("Error parsing response: %s", e)
 
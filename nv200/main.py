@@ -27,6 +27,25 @@ import logging
 # Global module locker
 logger = logging.getLogger(__name__)
 
+# Dark plot style applied on top of matplotlib's 'dark_background' style in a single
+# rcParams update instead of individual pyplot calls for each figure
+PLOT_STYLE = {
+    'agg.path.chunksize': 10000,  # draw long recordings / waveforms in chunks
+    'axes.grid': True,
+    'axes.edgecolor': 'darkgray',
+    'grid.color': 'darkgray',
+    'grid.linestyle': '--',
+    'grid.linewidth': 0.5,
+    'xtick.color': 'darkgray',
+    'ytick.color': 'darkgray',
+    'xtick.minor.visible': True,
+    'ytick.minor.visible': True,
+    'legend.facecolor': 'darkgray',
+    'legend.edgecolor': 'darkgray',
+    'legend.loc': 'best',
+    'legend.fontsize': 10,
+}
+
 
 async def basic_tests(client: NV200Device):
     """
@@ -54,39 +73,28 @@ async def basic_tests(client: NV200Device):
     print("Heat sink temperature:", await client.get_heat_sink_temperature())
     print(await client.get_status_register())
     print("Is status flag ACTUATOR_CONNECTED set: ", await client.is_status_flag_set(StatusFlags.ACTUATOR_CONNECTED))
-    print("posmin:", await client.read_float_value('posmin'))
-    print("posmax:", await client.read_float_value('posmax'))
-    print("avmin:", await client.read_float_value('avmin'))
-    print("avmax:", await client.read_float_value('avmax'))
+    # Read the range limits with a single pipelined round-trip
+    for cmd, params in await client.read_multi(['posmin', 'posmax', 'avmin', 'avmax']):
+        print(f"{cmd}:", float(params[0]))
 
 
-def prepare_plot_style():
+def set_plot_labels():
     """
-    Configures the plot style for a matplotlib figure with a dark background theme.
+    Sets the axis labels, title, minor grid and legend of the current matplotlib figure.
     """
-    # use dark background
-    plt.style.use('dark_background')
-
-    # Labels and title
     plt.xlabel("Time (ms)")
     plt.ylabel("Value")
     plt.title("Sampled Data from NV200 Data Recorder")
-
-    # Show grid and legend
-    plt.grid(True, color='darkgray', linestyle='--', linewidth=0.5)
-    plt.minorticks_on()
     plt.grid(which='minor', color='darkgray', linestyle=':', linewidth=0.5)
-    plt.legend(facecolor='darkgray', edgecolor='darkgray', frameon=True, loc='best', fontsize=10)
+    plt.legend(frameon=True)
 
-    ax = plt.gca()
-    ax.spines['top'].set_color('darkgray')
-    ax.spines['right'].set_color('darkgray')
-    ax.spines['bottom'].set_color('darkgray')
-    ax.spines['left'].set_color('darkgray')
 
-    # Set tick parameters for dark grey color
-    ax.tick_params(axis='x', colors='darkgray')
-    ax.tick_params(axis='y', colors='darkgray')
+def prepare_plot_style():
+    """
+    Configures the plot style for a matplotlib figure with a dark background theme.
+    """
+    plt.style.use(('dark_background', PLOT_STYLE))
+    set_plot_labels()
 
 def show_plot():
     """
@@ -114,10 +122,12 @@ async def data_recorder_tests(device: NV200Device):
 
     # Create a DataRecorder instance and configure it
     recorder = DataRecorder(device)
-    await recorder.set_data_source(0, DataRecorderSource.PIEZO_POSITION)
-    await recorder.set_data_source(1, DataRecorderSource.PIEZO_VOLTAGE)
-    await recorder.set_autostart_mode(RecorderAutoStartMode.START_ON_SET_COMMAND)
-    rec_param = await recorder.set_recording_duration_ms(100)
+    rec_param = await recorder.configure(
+        DataRecorderSource.PIEZO_POSITION,
+        DataRecorderSource.PIEZO_VOLTAGE,
+        RecorderAutoStartMode.START_ON_SET_COMMAND,
+        duration_ms=100
+    )
     print("Recording parameters:")
     print(f"  Used buffer entries: {rec_param.bufsize}")
     print(f"  Stride: {rec_param.stride}")
@@ -126,7 +136,7 @@ async def data_recorder_tests(device: NV200Device):
     # Start recording and move the device to a new position to record the parameters
     await recorder.start_recording()
     await device.move_to_position(80)
-    await asyncio.sleep(0.4)
+    await recorder.wait_until_finished(timeout_s=0.4)
     print("Reading recorded data of both channels...")
 
     # Read the recorded data from the DataRecorder
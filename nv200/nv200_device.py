@@ -1,7 +1,7 @@
-from typing import Dict, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, Mapping, Optional, Tuple, TYPE_CHECKING
+from types import MappingProxyType
 from pathlib import Path
 import os
-import configparser
 from datetime import datetime
 from nv200.device_base import PiezoDeviceBase
 from nv200.shared_types import (
@@ -15,6 +15,7 @@ from nv200.shared_types import (
     SPIMonitorSource,
     PIDGains,
     PCFGains,
+    DeviceStateSnapshot,
     CtrlMode,
     ValueRange,
     PostionSensorType,
@@ -31,6 +32,11 @@ if TYPE_CHECKING:
     # For forward reference of NV200Device within inner classes
     from typing import Any
 
+# Plain command values bound once at import for the frequently called motion methods
+_CLOSED_LOOP_MODE = PidLoopMode.CLOSED_LOOP.value  # cl value for closed loop
+_OPEN_LOOP_MODE = PidLoopMode.OPEN_LOOP.value  # cl value for open loop
+_SET_CMD_SOURCE = ModulationSource.SET_CMD.value  # modsrc value for setpoint via set command
+
 
 class NV200Device(PiezoDeviceBase):
     """
@@ -65,13 +71,17 @@ class NV200Device(PiezoDeviceBase):
         "setlpf",
         "setlpon",
         "poslpf",
-        "poslpon"
+        "poslpon",
         "notchf",
         "notchon",
         "notchb",
-        "acmeasure"
+        "acmeasure",
+        "desc",
+        "acserno",
+        "recstr",
+        "reclen"
     }
-    _help_dict: dict[str, str] = {
+    _help_dict: Mapping[str, str] = MappingProxyType({
         # General Commands
         "s": "Print full command list",
         "reset": "Hardware-reset of the controller",
@@ -188,7 +198,7 @@ class NV200Device(PiezoDeviceBase):
         "igt": "Correction mode (0=no learning, 1=offline ID, 2=online ID)",
         "isave": "Save ILC learning profiles to actuator",
         "iload": "Load ILC learning profiles from actuator",
-    }
+    })
 
     class LowpassFilter:
         """
@@ -356,12 +366,24 @@ class NV200Device(PiezoDeviceBase):
             return await self.get_mode() == PidLoopMode.CLOSED_LOOP
 
         async def set_mode(self, mode: PidLoopMode):
-            """Sets the PID mode of the device to either open loop or closed loop."""
-            await self._device.write_value('cl', mode.value)
+            """
+            Sets the PID mode of the device to either open loop or closed loop.
+
+            The device does not reply to a valid mode, so the command is sent without
+            waiting for a reply. Device errors are not raised by this method.
+            """
+            await self._device.write_value('cl', mode.value, wait_for_reply=False)
 
         async def get_mode(self) -> PidLoopMode:
             """Retrieves the current PID mode of the device."""
-            return PidLoopMode(await self._device.read_int_value('cl'))
+            return PidLoopMode(await self.get_mode_value())
+
+        async def get_mode_value(self) -> int:
+            """
+            Retrieves the current PID mode as plain integer value (0 = open loop, 1 = closed loop).
+            Use this in polling loops to avoid the construction of a PidLoopMode enum.
+            """
+            return await self._device.read_int_value('cl')
         
 
         async def set_pid_gains(self, kp: float | None = None, ki: float | None = None, kd: float | None = None) -> None:
@@ -461,13 +483,19 @@ class NV200Device(PiezoDeviceBase):
             detected_device (DetectedDevice): The detected device object to enrich with additional information.
         """
         detected_device.device_info.clear()
-        detected_device.device_info['actuator_name'] = await self.get_actuator_name()
-        detected_device.device_info['actuator_serial'] = await self.get_actuator_serial_number()
+        actuator_name, actuator_serial = await self.read_string_values(['desc', 'acserno'])
+        detected_device.device_info['actuator_name'] = actuator_name
+        detected_device.device_info['actuator_serial'] = actuator_serial
 
     
     async def set_modulation_source(self, source: ModulationSource):
-        """Sets the setpoint modulation source."""
-        await self.write_value("modsrc", source.value)
+        """
+        Sets the setpoint modulation source.
+
+        The device does not reply to a valid source, so the command is sent without
+        waiting for a reply. Device errors are not raised by this method.
+        """
+        await self.write_value("modsrc", source.value, wait_for_reply=False)
 
     async def get_modulation_source(self) -> ModulationSource:
         """Retrieves the current setpoint modulation source."""
@@ -490,9 +518,19 @@ class NV200Device(PiezoDeviceBase):
         return AnalogMonitorSource(await self.read_int_value('monsrc'))
     
     async def set_setpoint(self, setpoint: float):
-        """Sets the setpoint value for the device."""
+        """
+        Sets the setpoint value for the device.
+        A device error, i.e. for an out of range setpoint, is raised as `DeviceError`.
+        """
         await self.write_value("set", setpoint)
 
+    async def stream_setpoints(self, setpoints: Iterable[float]):
+        """
+        Sends a sequence of setpoint values to the device with a single transport write.
+        The setpoints are applied by the device in the given order as fast as they are received.
+        """
+        await self.write_values("set", setpoints)
+
     async def get_setpoint(self) -> float:
         """Retrieves the current setpoint of the device."""
         return await self.read_float_value('set')
@@ -575,25 +613,45 @@ class NV200Device(PiezoDeviceBase):
         """Retrieves the current trigger pulse length in samples."""
         return await self.read_int_value('trglen')
     
+    async def _move_in_mode(self, mode: Optional[int], target: float):
+        """
+        Sends the PID mode, modulation source and setpoint commands in a single batched write.
+        The PID mode and modulation source commands are skipped if the command cache shows
+        that the device is already in the requested state. The batch is not acknowledged by
+        the device, so the written values are not cached and device errors are not raised.
+        Any error reply is discarded before the next transport write. The mode is the plain
+        cl value - if it is None, the current PID mode is kept.
+        """
+        state = {"modsrc": _SET_CMD_SOURCE}
+        if mode is not None:
+            state = {"cl": mode, **state}
+        cmds = [f"{cmd},{value}" for cmd, value in state.items() if not self._is_cached_value(cmd, value)]
+        cmds.append(f"set,{target}")
+        await self.write_batch(cmds, wait_for_reply=False)
+
     async def move_to_position(self, position: float):
-        """Moves the device to the specified position in closed loop"""
-        await self.pid.set_mode(PidLoopMode.CLOSED_LOOP)
-        await self.set_modulation_source(ModulationSource.SET_CMD)
-        await self.set_setpoint(position)
+        """
+        Moves the device to the specified position in closed loop.
+        The commands are sent without waiting for a reply, so device errors (i.e. for an
+        out of range position) are not raised. Use `set_setpoint` for a checked write.
+        """
+        await self._move_in_mode(_CLOSED_LOOP_MODE, position)
 
     async def move_to_voltage(self, voltage: float):
-        """Moves the device to the specified voltage in open loop"""
-        await self.pid.set_mode(PidLoopMode.OPEN_LOOP)
-        await self.set_modulation_source(ModulationSource.SET_CMD)
-        await self.set_setpoint(voltage)
+        """
+        Moves the device to the specified voltage in open loop.
+        The commands are sent without waiting for a reply, so device errors (i.e. for an
+        out of range voltage) are not raised. Use `set_setpoint` for a checked write.
+        """
+        await self._move_in_mode(_OPEN_LOOP_MODE, voltage)
 
     async def move(self, target: float):
         """
         Moves the device to the specified target position or voltage.
         The target is interpreted as a position in closed loop or a voltage in open loop.
+        The commands are sent without waiting for a reply, so device errors are not raised.
         """
-        await self.set_modulation_source(ModulationSource.SET_CMD)
-        await self.set_setpoint(target)
+        await self._move_in_mode(None, target)
 
     async def get_current_position(self) -> float:
         """
@@ -624,8 +682,7 @@ class NV200Device(PiezoDeviceBase):
         Retrieves the position range of the device for closed loop control.
         Returns a tuple containing the minimum and maximum position.
         """
-        min_pos = await self.get_min_position()
-        max_pos = await self.get_max_position()
+        min_pos, max_pos = await self.read_float_values(['posmin', 'posmax'])
         return (min_pos, max_pos)
     
     async def get_max_voltage(self) -> float:
@@ -647,8 +704,7 @@ class NV200Device(PiezoDeviceBase):
         Retrieves the voltage range of the device for open loop control.
         Returns a tuple containing the minimum and maximum voltage.
         """
-        min_voltage = await self.get_min_voltage()
-        max_voltage = await self.get_max_voltage()
+        min_voltage, max_voltage = await self.read_float_values(['avmin', 'avmax'])
         return (min_voltage, max_voltage)
     
     async def get_setpoint_range(self) -> Tuple[float, float]:
@@ -658,10 +714,13 @@ class NV200Device(PiezoDeviceBase):
         The setpoint range is determined by the position range for closed loop control
         and the voltage range for open loop control.
         """
-        if await self.pid.get_mode() == PidLoopMode.CLOSED_LOOP:
-            return await self.get_position_range()
+        # Fetch the mode and both ranges speculatively in a single request
+        mode, posmin, posmax, avmin, avmax = await self.read_string_values(
+            ['cl', 'posmin', 'posmax', 'avmin', 'avmax'])
+        if int(mode) == _CLOSED_LOOP_MODE:
+            return (float(posmin), float(posmax))
         else:
-            return await self.get_voltage_range()
+            return (float(avmin), float(avmax))
         
     async def get_voltage_unit(self) -> str:
         """
@@ -683,10 +742,12 @@ class NV200Device(PiezoDeviceBase):
         Retrieves the current setpoint unit of the device.
         This is typically "V" for volts in open loop or the position unit in closed loop.
         """
-        if await self.pid.get_mode() == PidLoopMode.CLOSED_LOOP:
-            return await self.get_position_unit()
+        # Fetch the mode and both units speculatively in a single request
+        mode, position_unit, voltage_unit = await self.read_string_values(['cl', 'unitcl', 'unitol'])
+        if int(mode) == _CLOSED_LOOP_MODE:
+            return position_unit
         else:
-            return await self.get_voltage_unit()
+            return voltage_unit
 
     async def get_heat_sink_temperature(self) -> float:
         """
@@ -698,14 +759,33 @@ class NV200Device(PiezoDeviceBase):
         """
         Retrieves the status register of the device.
         """
-        return StatusRegister(await self.read_int_value('stat'))
+        return StatusRegister(await self.get_status_register_value())
+
+    async def get_status_register_value(self) -> int:
+        """
+        Retrieves the raw 16-bit value of the status register.
+        Use this in polling loops and test the bits with `StatusFlags` directly.
+        """
+        return await self.read_int_value('stat')
+
+    async def get_state_snapshot(self) -> DeviceStateSnapshot:
+        """
+        Reads the current position, heat sink temperature, status register and PID mode
+        in a single round-trip.
+        """
+        meas, temp, stat, cl = await self.read_multi(['meas', 'temp', 'stat', 'cl'])
+        return DeviceStateSnapshot(
+            position=float(meas[1][0]),
+            heat_sink_temperature=float(temp[1][0]),
+            status_register=StatusRegister(int(stat[1][0])),
+            pid_mode=PidLoopMode(int(cl[1][0]))
+        )
 
     async def is_status_flag_set(self, flag: StatusFlags) -> bool:
         """
         Checks if a specific status flag is set in the status register.
         """
-        status_reg = await self.get_status_register()
-        return status_reg.has_flag(flag)
+        return bool(await self.get_status_register_value() & flag)
     
     async def get_actuator_name(self) -> str:
         """
@@ -725,8 +805,7 @@ class NV200Device(PiezoDeviceBase):
         The description consists of the actuator type and the serial number.
         For example: "TRITOR100SG, #85533"
         """
-        name = await self.get_actuator_name()
-        serial_number = await self.get_actuator_serial_number()   
+        name, serial_number = await self.read_string_values(['desc', 'acserno'])
         return f"{name} #{serial_number}"
     
     async def get_actuator_sensor_type(self) -> PostionSensorType:
@@ -756,8 +835,7 @@ class NV200Device(PiezoDeviceBase):
         Sets the slew rate of the device.
         0.0000008 ... 2000.0 %ms⁄ (2000 = disabled)
         """
-        async with self.lock:
-            await self.write_value("sr", slew_rate)
+        await self.write_value("sr", slew_rate)
 
 
     async def default_actuator_export_filename(self) -> str:
@@ -765,8 +843,7 @@ class NV200Device(PiezoDeviceBase):
         Return the default filename for exporting actuator configuration.
         The filename is based on the actuator's description and serial number.
         """
-        desc = await self.get_actuator_name()
-        acserno = await self.get_actuator_serial_number()
+        desc, acserno = await self.read_string_values(['desc', 'acserno'])
         return f"actuator_conf_{desc}_{acserno}.ini"
     
 
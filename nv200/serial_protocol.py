@@ -11,6 +11,19 @@ from nv200.device_base import PiezoDeviceBase, DEVICE_MODEL_REGISTRY
 # Global module locker
 logger = logging.getLogger(__name__)
 
+FTDI_VENDOR_ID = 0x0403  # USB vendor ID of the FTDI USB serial converter used by the devices
+MAX_CONCURRENT_PORT_PROBES = 8  # Limit of serial ports opened at the same time during discovery
+
+
+def _is_ftdi_port(port) -> bool:
+    """
+    Returns True if the given serial port belongs to an FTDI USB serial converter.
+    The USB vendor ID is checked first because the manufacturer string is often not
+    available on Linux.
+    """
+    return port.vid == FTDI_VENDOR_ID or port.manufacturer == "FTDI"
+
+
 class SerialProtocol(TransportProtocol):
     """
     A class to handle serial communication with an NV200 device using the AioSerial library.
@@ -20,6 +33,8 @@ class SerialProtocol(TransportProtocol):
         baudrate (int): The baud rate for the serial connection. Defaults to 115200.
         serial (AioSerial): The AioSerial instance for asynchronous serial communication.
     """   
+    __slots__ = ('__serial', '__port', '__baudrate', '__rx_buffer')
+
     def __init__(self, port : str | None  = None, baudrate : int = 115200):
         """
         Initializes the NV200 driver with the specified serial port settings.
@@ -33,6 +48,7 @@ class SerialProtocol(TransportProtocol):
         self.__serial : aioserial.AioSerial | None = None
         self.__port : str  | None = port
         self.__baudrate : int= baudrate
+        self.__rx_buffer = bytearray()  # Received bytes that are not yet returned by read_until
 
 
     @property
@@ -49,40 +65,53 @@ class SerialProtocol(TransportProtocol):
         """
         Asynchronously detects and configures the serial port for the NV200 device.
 
-        This method scans through all available serial ports to find one with a 
-        manufacturer matching "FTDI". If such a port is found, it attempts to 
+        This method scans through all available serial ports to find one with an
+        FTDI USB serial converter. If such a port is found, it attempts to 
         communicate with the device to verify if it is an NV200 device. If the 
         device is successfully detected, the port is configured and returned.
 
+        Each candidate port is opened with a fresh serial instance that is only kept
+        if the device has been detected on the port.
+
         Returns:
             str: The device name of the detected port if successful, otherwise None.
         """
         ports = serial.tools.list_ports.comports()
         for port in ports:
-            if port.manufacturer != "FTDI":
+            if not _is_ftdi_port(port):
                 continue
-            self.__serial.close()
-            self.__serial.port = port.device
-            self.__serial.open()
-            if await device.check_device_type():
+            try:
+                self.__serial = aioserial.AioSerial(port=port.device, xonxoff=False, baudrate=self.__baudrate)
+            except serial.SerialException as e:
+                logger.debug("Failed to open port %s: %s", port.device, e)
+                continue
+            try:
+                is_match, _ = await device.check_device_type()
+            except Exception as e:
+                logger.debug("Device detection failed on port %s: %s", port.device, e)
+                is_match = False
+            if is_match:
                 return port.device
-            else:
-                self.__serial.close()
+            self.__serial.close()
+        self.__serial = None
         return None
     
 
     @staticmethod
-    async def discover_devices(flags: DiscoverFlags)  -> List[DetectedDevice]:
+    def _create_port_probes() -> List[asyncio.Task]:
         """
-        Asynchronously discovers all devices connected via serial interface.
-
-        Returns:
-            list: A list of serial port strings where a device has been detected.
+        Creates one task per FTDI serial port that checks if a supported device is connected
+        to the port. At most MAX_CONCURRENT_PORT_PROBES ports are opened at the same time.
         """
         ports = serial.tools.list_ports.comports()
-        valid_ports = [p.device for p in ports if p.manufacturer == "FTDI"]
+        valid_ports = [p.device for p in ports if _is_ftdi_port(p)]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PORT_PROBES)
 
         async def detect_on_port(port_name: str) -> DetectedDevice | None:
+            async with semaphore:
+                return await probe_port(port_name)
+
+        async def probe_port(port_name: str) -> DetectedDevice | None:
             protocol = SerialProtocol(port_name)
             try:
                 detected_device = DetectedDevice(
@@ -105,11 +134,43 @@ class SerialProtocol(TransportProtocol):
             finally:
                 await protocol.close()
 
+        return [asyncio.create_task(detect_on_port(port)) for port in valid_ports]
+
+
+    @staticmethod
+    async def discover_devices(flags: DiscoverFlags)  -> List[DetectedDevice]:
+        """
+        Asynchronously discovers all devices connected via serial interface.
+
+        Returns:
+            list: A list of serial port strings where a device has been detected.
+        """
         # Run all detections concurrently
-        tasks = [detect_on_port(port) for port in valid_ports]
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*SerialProtocol._create_port_probes())
         # Filter out Nones
         return [dev for dev in results if dev]
+
+
+    @staticmethod
+    async def discover_first() -> DetectedDevice | None:
+        """
+        Asynchronously discovers the first device connected via serial interface.
+        All remaining port probes are cancelled as soon as a device has been detected.
+
+        Returns:
+            DetectedDevice: The first detected device or None if no device has been found.
+        """
+        tasks = SerialProtocol._create_port_probes()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                device = await next_done
+                if device:
+                    return device
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
 
     async def connect(self, auto_adjust_comm_params: bool = True, device : Optional['PiezoDeviceBase'] = None):
@@ -123,26 +184,36 @@ class SerialProtocol(TransportProtocol):
         Raises:
             RuntimeError: If the NV200 device cannot be detected or connected to.
         """
-        self.__serial = aioserial.AioSerial(port=self.__port, xonxoff=False, baudrate=self.__baudrate)
         if self.__port is None:
             self.__port = await self.detect_port(device)
-        if self.__port is None:
-            raise RuntimeError("NV200 device not found")
+            if self.__port is None:
+                raise RuntimeError("NV200 device not found")
+        else:
+            self.__serial = aioserial.AioSerial(port=self.__port, xonxoff=False, baudrate=self.__baudrate)
 
     async def flush_input(self):
         """
         Discard all available input within a short timeout window.
         """
+        self.__rx_buffer.clear()
         self.__serial.reset_input_buffer()
 
     async def write(self, cmd: str):
-        await self.flush_input()
         await self.__serial.write_async(cmd.encode('latin1'))
 
     async def read_until(self, expected: bytes = TransportProtocol.XON, timeout : float = TransportProtocol.DEFAULT_TIMEOUT_SECS) -> str:
-        data = await asyncio.wait_for(self.__serial.read_until_async(expected), timeout)
-        #return data.replace(TransportProtocol.XON, b'').replace(TransportProtocol.XOFF, b'') # strip XON and XOFF characters
-        return data.decode('latin1').strip("\x11\x13") # strip XON and XOFF characters
+        # pyserial's read_until reads byte by byte - so all bytes that are already waiting are
+        # read at once into a local buffer and complete messages are split off from the buffer
+        buffer = self.__rx_buffer
+        start = 0
+        async with asyncio.timeout(timeout):
+            while (index := buffer.find(expected, start)) < 0:
+                start = max(0, len(buffer) - len(expected) + 1)
+                buffer += await self.__serial.read_async(max(1, self.__serial.in_waiting))
+        end = index + len(expected)
+        data = bytes(buffer[:end])
+        del buffer[:end]
+        return data.strip(b"\x11\x13").decode('latin1') # strip XON and XOFF characters before decoding
 
     async def close(self):
         if self.__serial:
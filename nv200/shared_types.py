@@ -26,6 +26,8 @@ Functionality:
 
 from enum import Enum, IntFlag, Flag, auto
 from dataclasses import dataclass, field
+from functools import lru_cache
+import numpy as np
 from typing import (
     Generator,
     Optional,
@@ -169,20 +171,25 @@ class ErrorCode(Enum):
             str: A string describing the error associated with the provided error code.
                  If the error code is not recognized, "Unknown error" is returned.
         """
-        descriptions = {
-            cls.ERROR_NOT_SPECIFIED: "Error not specified",
-            cls.UNKNOWN_COMMAND: "Unknown command",
-            cls.PARAMETER_MISSING: "Parameter missing",
-            cls.ADMISSIBLE_PARAMETER_RANGE_EXCEEDED: "Admissible parameter range exceeded",
-            cls.COMMAND_PARAMETER_COUNT_EXCEEDED: "Command's parameter count exceeded",
-            cls.PARAMETER_LOCKED_OR_READ_ONLY: "Parameter is locked or read only",
-            cls.UNDERLOAD: "Underload",
-            cls.OVERLOAD: "Overload",
-            cls.PARAMETER_TOO_LOW: "Parameter too low",
-            cls.PARAMETER_TOO_HIGH: "Parameter too high"
-        }
-        return descriptions.get(error_code, "Unknown error")
-    
+        return _ERROR_CODE_DESCRIPTIONS.get(error_code, "Unknown error")
+
+
+# Descriptions of the error codes - defined outside of the enum class body
+# because Enum would turn a class attribute into an enum member
+_ERROR_CODE_DESCRIPTIONS = {
+    ErrorCode.ERROR_NOT_SPECIFIED: "Error not specified",
+    ErrorCode.UNKNOWN_COMMAND: "Unknown command",
+    ErrorCode.PARAMETER_MISSING: "Parameter missing",
+    ErrorCode.ADMISSIBLE_PARAMETER_RANGE_EXCEEDED: "Admissible parameter range exceeded",
+    ErrorCode.COMMAND_PARAMETER_COUNT_EXCEEDED: "Command's parameter count exceeded",
+    ErrorCode.PARAMETER_LOCKED_OR_READ_ONLY: "Parameter is locked or read only",
+    ErrorCode.UNDERLOAD: "Underload",
+    ErrorCode.OVERLOAD: "Overload",
+    ErrorCode.PARAMETER_TOO_LOW: "Parameter too low",
+    ErrorCode.PARAMETER_TOO_HIGH: "Parameter too high"
+}
+
+
 class StatusFlags(IntFlag):
     """
     Enum representing the individual status flags within a 16-bit status register.
@@ -210,14 +217,13 @@ class StatusFlags(IntFlag):
         :param value: The 16-bit status register value.
         :return: A string describing the sensor type.
         """
-        sensor_bits = (value & (StatusFlags.SENSOR_TYPE_0 | StatusFlags.SENSOR_TYPE_1)) >> 1
-        sensor_types = {
-            0b00: "No position sensor",
-            0b01: "Strain gauge sensor",
-            0b10: "Capacitive sensor"
-        }
-        return sensor_types.get(sensor_bits, "Unknown")
-    
+        return _SENSOR_TYPES[(value >> 1) & 0b11]
+
+
+# Sensor type descriptions indexed by the two sensor type bits of the status register -
+# defined outside of the enum class body because IntFlag would turn it into a member
+_SENSOR_TYPES = ("No position sensor", "Strain gauge sensor", "Capacitive sensor", "Unknown")
+
 
 class ModulationSource(Enum):
     """
@@ -283,15 +289,23 @@ class StatusRegister:
     """
     A class representing the 16-bit status register of an actuator or amplifier.
     """
+    __slots__ = ('value',)
+
     def __init__(self, value: int):
         """
         Initializes the StatusRegister with a given 16-bit value.
         
         :param value: The 16-bit status register value.
         """
-        self.flags = StatusFlags(value)
         self.value = value
 
+    @property
+    def flags(self) -> StatusFlags:
+        """
+        Returns the register value as StatusFlags. The flags are only constructed on access.
+        """
+        return StatusFlags(self.value)
+
     def has_flag(self, flag: StatusFlags):
         """
         Checks if a given status flag is set in the register.
@@ -299,7 +313,7 @@ class StatusRegister:
         :param flag: A StatusFlags enum value to check.
         :return: True if the flag is set, False otherwise.
         """
-        return bool(self.flags & flag)
+        return bool(self.value & flag)
 
     def __repr__(self):
         """
@@ -307,20 +321,23 @@ class StatusRegister:
         
         :return: A formatted string showing the status register details.
         """
-        return (f"StatusRegister(value={self.value:#06x}):\n"
-                f"\tActuator Connected={self.has_flag(StatusFlags.ACTUATOR_CONNECTED)}\n"
-                f"\tSensor={StatusFlags.get_sensor_type(self.value)}\n"
-                f"\tClosed Loop Mode={self.has_flag(StatusFlags.CLOSED_LOOP_MODE)}\n"
-                f"\tLow Pass Filter={self.has_flag(StatusFlags.LOW_PASS_FILTER_ON)}\n"
-                f"\tNotch Filter={self.has_flag(StatusFlags.NOTCH_FILTER_ON)}\n"
-                f"\tSignal Processing={self.has_flag(StatusFlags.SIGNAL_PROCESSING_ACTIVE)}\n"
-                f"\tBridged Amplifier={self.has_flag(StatusFlags.AMPLIFIER_CHANNELS_BRIDGED)}\n"
-                f"\tTemp High={self.has_flag(StatusFlags.TEMPERATURE_TOO_HIGH)}\n"
-                f"\tActuator Error={self.has_flag(StatusFlags.ACTUATOR_ERROR)}\n"
-                f"\tHardware Error={self.has_flag(StatusFlags.HARDWARE_ERROR)}\n"
-                f"\tI2C Error={self.has_flag(StatusFlags.I2C_ERROR)}\n"
-                f"\tLower Limit Reached={self.has_flag(StatusFlags.LOWER_CONTROL_LIMIT_REACHED)}\n"
-                f"\tUpper Limit Reached={self.has_flag(StatusFlags.UPPER_CONTROL_LIMIT_REACHED)}")
+        v = self.value
+        return "\n\t".join((
+            f"StatusRegister(value={v:#06x}):",
+            f"Actuator Connected={bool(v & StatusFlags.ACTUATOR_CONNECTED)}",
+            f"Sensor={_SENSOR_TYPES[(v >> 1) & 0b11]}",
+            f"Closed Loop Mode={bool(v & StatusFlags.CLOSED_LOOP_MODE)}",
+            f"Low Pass Filter={bool(v & StatusFlags.LOW_PASS_FILTER_ON)}",
+            f"Notch Filter={bool(v & StatusFlags.NOTCH_FILTER_ON)}",
+            f"Signal Processing={bool(v & StatusFlags.SIGNAL_PROCESSING_ACTIVE)}",
+            f"Bridged Amplifier={bool(v & StatusFlags.AMPLIFIER_CHANNELS_BRIDGED)}",
+            f"Temp High={bool(v & StatusFlags.TEMPERATURE_TOO_HIGH)}",
+            f"Actuator Error={bool(v & StatusFlags.ACTUATOR_ERROR)}",
+            f"Hardware Error={bool(v & StatusFlags.HARDWARE_ERROR)}",
+            f"I2C Error={bool(v & StatusFlags.I2C_ERROR)}",
+            f"Lower Limit Reached={bool(v & StatusFlags.LOWER_CONTROL_LIMIT_REACHED)}",
+            f"Upper Limit Reached={bool(v & StatusFlags.UPPER_CONTROL_LIMIT_REACHED)}"
+        ))
 
 
 class DeviceError(Exception):
@@ -338,8 +355,10 @@ class DeviceError(Exception):
         ValueError: If the provided error_code is not a valid instance of the ErrorCode enum.
     """
     def __init__(self, error_code : ErrorCode):
+        if not isinstance(error_code, ErrorCode):
+            error_code = ErrorCode.from_value(error_code)
         self.error_code = error_code
-        self.description = ErrorCode.get_description(error_code)
+        self.description = _ERROR_CODE_DESCRIPTIONS.get(error_code, "Unknown error")
         # Call the base class constructor with the formatted error message
         super().__init__(f"Error {self.error_code.value}: {self.description}")
 
@@ -503,6 +522,17 @@ class NetworkEndpoint:
         return f"MAC={self.mac}, IP={self.ip}"
 
 
+@lru_cache(maxsize=8)
+def _time_axis_ms(count: int, sample_time_ms: float) -> np.ndarray:
+    """
+    Returns the read-only time axis in milliseconds for the given number of samples and sample time.
+    The result is cached because repeated recordings usually share the same parameters.
+    """
+    time_axis = np.arange(count, dtype=np.float64) * sample_time_ms
+    time_axis.flags.writeable = False
+    return time_axis
+
+
 class TimeSeries:
     """
     TimeSeries represents waveform data with amplitude values (values) and corresponding sample times (sample_times_ms).
@@ -608,7 +638,7 @@ class TimeSeries:
         """
         Return all time (sample_times_ms) values as a list, calculated based on the sample time.
         """
-        return list(self.generate_sample_times_ms())
+        return _time_axis_ms(len(self._values), self._sample_time_ms).tolist()
 
     def __str__(self):
         """
@@ -638,6 +668,16 @@ class PCFGains(NamedTuple):
     acceleration: float  # Note: scaled internally by 1/1_000_000
 
 
+class DeviceStateSnapshot(NamedTuple):
+    """
+    A snapshot of frequently polled NV200 state values read in a single round-trip.
+    """
+    position: float
+    heat_sink_temperature: float
+    status_register: StatusRegister
+    pid_mode: PidLoopMode
+
+
 
 ValueRangeType = TypeVar("ValueRangeType")
 
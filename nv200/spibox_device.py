@@ -8,6 +8,17 @@ import numpy as np
 from enum import Enum
 
 
+MAX_VALID_HEX = 0xFFFE  # Largest valid 16-bit sample value - corresponds to 100 %
+_INVALID_NIBBLE = 0x10  # Marker for characters that are no hex digits
+_PERCENT_TO_HEX_SCALE = MAX_VALID_HEX / 100  # Factor to scale percent values to 16-bit sample values
+
+# Lookup table that maps ASCII codes to hex nibble values
+_HEX_NIBBLE_LUT = np.full(256, _INVALID_NIBBLE, dtype=np.uint16)
+for _i, _c in enumerate("0123456789abcdef"):
+    _HEX_NIBBLE_LUT[ord(_c)] = _i
+    _HEX_NIBBLE_LUT[ord(_c.upper())] = _i
+
+
 def parse_hex_to_floats_percent(data: str) -> List[float]:
     """
     Parses a string of 4-character hexadecimal values into a float.
@@ -20,7 +31,6 @@ def parse_hex_to_floats_percent(data: str) -> List[float]:
     Returns:
         List[float]: A list of float representations of the parsed unsigned integers.
     """
-    MAX_VALID_HEX = 0xFFFE
     int_val = int(data, 16)
 
     if int_val > MAX_VALID_HEX:
@@ -30,14 +40,47 @@ def parse_hex_to_floats_percent(data: str) -> List[float]:
     return percent
 
 
+def parse_hex_values_to_floats_percent(hex_values: List[str]) -> List[float]:
+    """
+    Parses a list of 4-character hexadecimal values into percent values in one vectorized pass.
+
+    The ASCII characters of all values are decoded to nibbles with a lookup table and
+    combined into unsigned 16-bit integers. Values above 0xFFFE are clipped like in
+    `parse_hex_to_floats_percent`.
+
+    Args:
+        hex_values (List[str]): A list of 4-character hex strings (e.g., ["0000", "FFFD"]).
+
+    Returns:
+        List[float]: The percent values of the parsed unsigned integers.
+
+    Raises:
+        ValueError: If a value contains characters that are no hex digits.
+    """
+    joined = "".join(hex_values)
+    if len(joined) != 4 * len(hex_values):
+        # Values with other lengths than 4 characters are parsed one by one
+        return [parse_hex_to_floats_percent(value) for value in hex_values]
+
+    nibbles = _HEX_NIBBLE_LUT[np.frombuffer(joined.encode("latin1"), dtype=np.uint8)].reshape(-1, 4)
+    if (nibbles == _INVALID_NIBBLE).any():
+        raise ValueError(f"Invalid hex value in: {hex_values}")
+    int_vals = (nibbles[:, 0] << 12) | (nibbles[:, 1] << 8) | (nibbles[:, 2] << 4) | nibbles[:, 3]
+    np.minimum(int_vals, MAX_VALID_HEX, out=int_vals)
+    return (int_vals * (100.0 / MAX_VALID_HEX)).tolist()
+
+
 def percent_to_hex(value: float) -> str:
     """
     Converts a percentage value (0.0 to 100.0) to a 4-digit hexadecimal string.
     """
-    # Clip value to range [0.0, 100.0]
-    value = max(0.0, min(value, 100.0))
-    # Scale to [0x0000, 0xFFFE]
-    int_val = int(round(value / 100 * 0xFFFE))
+    # Clip value to range [0.0, 100.0] and scale to [0x0000, 0xFFFE] - NaN is mapped to 0
+    if not value > 0.0:
+        int_val = 0
+    elif value >= 100.0:
+        int_val = MAX_VALID_HEX
+    else:
+        int_val = round(value * _PERCENT_TO_HEX_SCALE)
     return f"{int_val:04x}"
 
 
@@ -49,6 +92,7 @@ class SpiBoxDevice(PiezoDeviceBase):
     for setting and getting various device parameters, such as PID mode, setpoint,
     """
     DEVICE_ID = "SPI Controller Box"
+    DATA_CMD = "set"  # Command to set and get the SPI setpoint data
 
     class WaveformState(Enum):
         STOPPED          = 0
@@ -65,13 +109,6 @@ class SpiBoxDevice(PiezoDeviceBase):
         """
         return isinstance(self._transport, SerialProtocol)
     
-    def __get_data_cmd(self) -> str:
-        """
-        Returns the command to get data based on the connection type.
-        This method is a placeholder and should be implemented based on actual connection checks.
-        """
-        return "set"
-    
     async def connect(self, auto_adjust_comm_params: bool = True):
         """
         Establishes a connection using the transport layer.
@@ -112,13 +149,20 @@ class SpiBoxDevice(PiezoDeviceBase):
         Returns:
             List[float]: A list containing the setpoints for each channel as percentages.
         """
-        cmd = self.__get_data_cmd()
-        parameters = []
+        return await self.__exchange_setpoints([])
 
-        # Read the setpoints 3 times to ensure we get the correct SPI response
-        for i in range(3):
-            command, parameters = await self.write(cmd)
+    async def __exchange_setpoints(self, cmds: List[str]) -> List[float]:
+        """
+        Sends the given commands followed by the SPI data read commands in a single
+        pipelined write and returns the setpoints parsed from the last response.
 
+        The data is read 3 times to ensure we get the correct SPI response, because
+        the SPI pipeline delays the response by one transfer.
+        """
+        responses = await self.write_batch(cmds + [self.DATA_CMD] * 3)
+        if not responses:
+            raise RuntimeError("No SPI data response received from device")
+        command, parameters = responses[-1]
         return self.__parse_hex_set(parameters)
 
     async def set_setpoints_percent(
@@ -137,15 +181,8 @@ class SpiBoxDevice(PiezoDeviceBase):
             ch2 (float): Setpoint for channel 2 (0.0 to 100.0).
             ch3 (float): Setpoint for channel 3 (0.0 to 100.0).
         """
-        cmd = self.__get_data_cmd()
-        hex1 = percent_to_hex(ch1)
-        hex2 = percent_to_hex(ch2)
-        hex3 = percent_to_hex(ch3)
-
-        full_cmd = f"{cmd},{hex1},{hex2},{hex3}"
-        await self.write(full_cmd)
-
-        return await self.get_setpoints_percent()
+        return await self.__exchange_setpoints(
+            [f"{self.DATA_CMD},{percent_to_hex(ch1)},{percent_to_hex(ch2)},{percent_to_hex(ch3)}"])
     
     async def set_waveform_cycles(
         self,
@@ -263,12 +300,7 @@ class SpiBoxDevice(PiezoDeviceBase):
         Returns:
             List[float]: A list of float values parsed from the hex strings.
         """
-        output = []
-
-        for hex_val in hex_set:
-            output.append(parse_hex_to_floats_percent(hex_val))
-
-        return output
+        return parse_hex_values_to_floats_percent(hex_set)
 
     async def get_waveform_response(
         self, 
@@ -1,21 +1,29 @@
 import asyncio
+import socket
 import telnetlib3
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 from nv200.transport_protocol import TransportProtocol
 import nv200.lantronix_xport as xport
-from nv200.shared_types import NetworkEndpoint, DetectedDevice, TransportType, DiscoverFlags, TransportProtocolInfo
+from nv200.shared_types import DetectedDevice, TransportType, DiscoverFlags, TransportProtocolInfo
 from nv200.device_base import PiezoDeviceBase
 
 # Global module locker
 logger = logging.getLogger(__name__)
 
+# IP addresses of devices that have been connected in this process, keyed by upper case MAC address.
+# Reconnecting to a known MAC tries the cached address first to skip the network discovery.
+_host_by_mac: Dict[str, str] = {}
+CACHED_HOST_CONNECT_TIMEOUT_S = 1  # Connect timeout for the cached address before falling back to discovery
+
 class TelnetProtocol(TransportProtocol):
     """
     TelnetTransport is a class that implements a transport protocol for communicating
     with piezosystem devices over Telnet. It provides methods to establish a connection,
     send commands, read responses, and close the connection.
     """
+    __slots__ = ('__host', '__port', '__MAC', '__reader', '__writer')
+
     def __init__(self, host: str = "", port: int = 23, MAC: str = ""):
         """
         Initializes the transport protocol.
@@ -33,14 +41,32 @@ class TelnetProtocol(TransportProtocol):
         self.__writer = None
 
 
-    async def __connect_telnetlib(self):
+    async def __connect_telnetlib(self, timeout: float = 5):
         """
         Connect to telnetlib3 library
         """
         self.__reader, self.__writer = await asyncio.wait_for(
             telnetlib3.open_connection(self.__host, self.__port),
-            timeout=5
-        )        
+            timeout=timeout
+        )
+        self.__configure_socket()
+
+
+    def __configure_socket(self):
+        """
+        Disables Nagle's algorithm and enables TCP keep-alive on the underlying socket.
+
+        The device protocol consists of small command frames that are sent back to back.
+        Without TCP_NODELAY these frames may be delayed by TCP segment coalescing.
+        """
+        sock = self.__writer.get_extra_info('socket')
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as exc:
+            logger.debug("Failed to configure socket options: %s", exc)
 
 
     async def is_xon_xoff_forwared_to_host(self) -> bool:
@@ -81,10 +107,29 @@ class TelnetProtocol(TransportProtocol):
         Once the device's IP address is determined, it establishes a Telnet
         connection to the device using the specified host and port.
 
+        If a connection to the device with the given MAC address has already been established
+        in this process, the previously used IP address is tried first. The communication
+        parameters have already been adjusted for this device. A direct discovery query to this
+        address verifies that it still belongs to the device with the given MAC address. Network
+        discovery is only performed if the device is not reachable at this address anymore.
+
         Raises:
             RuntimeError: If no devices are found during discovery.
         """
         if not self.__host and self.__MAC:
+            cached_host = _host_by_mac.get(self.__MAC.upper())
+            if cached_host:
+                if await xport.query_device_mac_async(cached_host) == self.__MAC.upper():
+                    try:
+                        self.__host = cached_host
+                        await self.__connect_telnetlib(CACHED_HOST_CONNECT_TIMEOUT_S)
+                        logger.debug("Connected to device %s at cached address %s", self.__MAC, cached_host)
+                        return
+                    except (asyncio.TimeoutError, OSError) as exc:
+                        logger.debug("Cached address %s of device %s not reachable: %s", cached_host, self.__MAC, exc)
+                else:
+                    logger.debug("Cached address %s does not belong to device %s anymore", cached_host, self.__MAC)
+                _host_by_mac.pop(self.__MAC.upper(), None)
             self.__host = await xport.discover_lantronix_device_async(self.__MAC)
             if not self.__host:
                 raise RuntimeError(f"Device with MAC address {self.__MAC} not found")
@@ -108,6 +153,10 @@ class TelnetProtocol(TransportProtocol):
         except asyncio.TimeoutError as exc:
             raise RuntimeError(f"Device with host address {self.__host} not found") from exc
 
+        # Only remember devices with adjusted communication parameters - reconnects skip the adjustment
+        if self.__MAC and auto_adjust_comm_params:
+            _host_by_mac[self.__MAC.upper()] = self.__host
+
 
     async def flush_input(self):
         """
@@ -115,7 +164,8 @@ class TelnetProtocol(TransportProtocol):
         """
         try:
             while True:
-                data = await asyncio.wait_for(self.__reader.read(1024), 0.01)
+                async with asyncio.timeout(0.01):
+                    data = await self.__reader.read(1024)
                 if not data:
                     break
         except asyncio.TimeoutError:
@@ -123,13 +173,13 @@ class TelnetProtocol(TransportProtocol):
 
 
     async def write(self, cmd: str):
-        await self.flush_input()
         self.__writer.write(cmd)
 
 
     async def read_until(self, expected: bytes = TransportProtocol.XON, timeout : float = TransportProtocol.DEFAULT_TIMEOUT_SECS) -> str:
-        data = await asyncio.wait_for(self.__reader.readuntil(expected), timeout)
-        return data.decode('latin1').strip("\x11\x13") # strip XON and XOFF characters
+        async with asyncio.timeout(timeout):
+            data = await self.__reader.readuntil(expected)
+        return data.strip(b"\x11\x13").decode('latin1') # strip XON and XOFF characters before decoding
         
 
     async def close(self):
@@ -159,34 +209,13 @@ class TelnetProtocol(TransportProtocol):
         Asynchronously discovers all devices connected via ethernet interface
 
         Returns:
-            list: A list of dictionaries containing device information (IP and MAC addresses).
+            list: A list of DetectedDevice instances with the IP and MAC address of each device.
         """
         network_endpoints = await xport.discover_lantronix_devices_async()
-    
-        async def detect_on_endpoint(network_endpoint: NetworkEndpoint) -> DetectedDevice | None:
-            logger.debug("Connecting to network endpoint: %s", network_endpoint)
-            protocol = TelnetProtocol(host=network_endpoint.ip)
-            try:
-                detected_device = DetectedDevice(
-                    transport=TransportType.TELNET,
-                    identifier=network_endpoint.ip,
-                    mac=network_endpoint.mac
-                )
-                    
-                return detected_device
-            except Exception as e:
-                # We do ignore the exception - if it is not possible to connect to the device, we just return None
-                print(f"Error for network endpoint {network_endpoint}: {e.__class__.__name__} {e}")
-                return None
-            finally:
-                await protocol.close()
-
-        # Run all detections concurrently
-        tasks = [detect_on_endpoint(endpoint) for endpoint in network_endpoints]
-        results = await asyncio.gather(*tasks)
-
-        # Filter out Nones
-        return [dev for dev in results if dev]
+        return [
+            DetectedDevice(TransportType.TELNET, endpoint.ip, endpoint.mac)
+            for endpoint in network_endpoints
+        ]
 
 
     def get_info(self) -> TransportProtocolInfo:
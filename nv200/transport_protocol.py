@@ -51,6 +51,7 @@ class TransportProtocol(ABC):
     CR = b'\x0D'
     CRLF = b'\x0D\x0A'
     DEFAULT_TIMEOUT_SECS = 0.6
+    __slots__ = ('rx_delimiter',)
 
     def __init__(self):
         """
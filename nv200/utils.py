@@ -71,13 +71,20 @@ class DeviceParamFile:
         Args:
             filepath (Path): The full path to the INI file to write.
         """
-        config = configparser.ConfigParser()
-        config[self.DEVICE_SECTION] = self.parameters
-        config[self.META_SECTION] = {"export_timestamp": self.timestamp}
+        # The INI content is emitted directly in the ConfigParser output format - there is no
+        # need to build a ConfigParser object graph just for writing a few key-value pairs
+        sections = (
+            (self.DEVICE_SECTION, self.parameters),
+            (self.META_SECTION, {"export_timestamp": self.timestamp}),
+        )
+        content = "".join(
+            f"[{section}]\n" + "".join(f"{key} = {value}\n" for key, value in values.items()) + "\n"
+            for section, values in sections
+        )
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with filepath.open("w", encoding="utf-8") as f:
-            config.write(f)
+            f.write(content)
 
     @classmethod
     def read(cls, filepath: Path, allowed_keys: Optional[set[str]] = None) -> "DeviceParamFile":
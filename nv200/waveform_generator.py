@@ -11,18 +11,28 @@ Classes:
 """
 import math
 import logging
+from functools import lru_cache
 import numpy as np
 from typing import List, Union, Sequence, Optional
 from enum import Enum
 
 from nv200.nv200_device import NV200Device, ModulationSource
-from nv200.shared_types import TimeSeries, ProgressCallback
+from nv200.shared_types import TimeSeries, ProgressCallback, DeviceError
 from nv200.utils import wait_until
 
 # Global module locker
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _sample_factor(sample_time_ms: float, base_sample_time_us: int) -> int:
+    """
+    Returns the factor of the base sample time that is required for the given sample time.
+    The result is cached because waveforms share a small number of distinct sample times.
+    """
+    return math.ceil((sample_time_ms * 1000) / base_sample_time_us)
+
+
 def calculate_sampling_time_ms(time_samples: Union[Sequence[float], np.ndarray]) -> float:
     """
     Calculates the sampling time in milliseconds from a sequence of time samples.
@@ -65,6 +75,8 @@ class WaveformGenerator:
     WaveformGenerator is a class responsible for generating waveforms using a connected device.
     """
     NV200_WAVEFORM_BUFFER_SIZE = 1024  # Size of the data buffer for waveform generator
+    WAVEFORM_WRITE_CHUNK_SIZE = 32  # Number of buffer values sent with a single transport write
+    WAVEFORM_READBACK_TOLERANCE = 0.01  # Allowed difference between written and read back buffer values in percent
     NV200_BASE_SAMPLE_TIME_US = 50  # Base sample time in microseconds
     NV200_INFINITE_CYCLES = 0  # Infinite cycles constant for the waveform generator
     
@@ -85,7 +97,7 @@ class WaveformGenerator:
             """
             Returns the sample factor used to calculate the sample time from the base sample time.
             """
-            return math.ceil((self.sample_time_ms * 1000) / WaveformGenerator.NV200_BASE_SAMPLE_TIME_US)
+            return _sample_factor(self.sample_time_ms, WaveformGenerator.NV200_BASE_SAMPLE_TIME_US)
         
         @property
         def cycle_time_ms(self):
@@ -199,10 +211,13 @@ class WaveformGenerator:
         The start index is the index where the waveform generator starts when it is started.
         The loop start index is the index where the waveform generator starts in the next cycle
         and the loop end index is the index where the waveform generator jumps to the next cycle.
+        All three indices are sent with a single transport write.
         """
-        await self.set_start_index(start_index)
-        await self.set_loop_start_index(loop_start_index)
-        await self.set_loop_end_index(loop_end_index)
+        await self._dev.write_batch([
+            f"goarb,{start_index}",
+            f"gsarb,{loop_start_index}",
+            f"gearb,{loop_end_index}"
+        ])
 
 
     async def get_loop_settings(self) -> dict:
@@ -213,10 +228,11 @@ class WaveformGenerator:
         - 'loop_start_index': The loop start index for the waveform generator.
         - 'loop_end_index': The loop end index for the waveform generator.
         """
+        start_index, loop_start_index, loop_end_index = await self._dev.read_string_values(['goarb', 'gsarb', 'gearb'])
         return {
-            'start_index': await self.get_start_index(),
-            'loop_start_index': await self.get_loop_start_index(),
-            'loop_end_index': await self.get_loop_end_index()
+            'start_index': int(start_index),
+            'loop_start_index': int(loop_start_index),
+            'loop_end_index': int(loop_end_index)
         }
 
     async def set_output_sampling_time(self, sampling_time: int):
@@ -266,8 +282,10 @@ class WaveformGenerator:
 
     async def set_waveform_buffer(self, buffer: list[float], unit: WaveformUnit = WaveformUnit.PERCENT, on_progress: Optional[ProgressCallback] = None):
         """
-        Writes a full waveform buffer to the device by setting each value
-        using set_waveform_value.
+        Writes a full waveform buffer to the device.
+        The values are sent in chunks of WAVEFORM_WRITE_CHUNK_SIZE commands with a single
+        transport write per chunk. The last value of each chunk is read back with the same
+        write to ensure that the device has processed the chunk before the next one is sent.
         The buffer should contain waveform values in percent (0-100).
         In closed loop mode, the value is interpreted as a percentage of the position range (i.e. 0 - 80 mra)
         and in open loop mode, the value is interpreted as a percentage of the voltage range (i.e. -20 - 130 V).
@@ -279,6 +297,8 @@ class WaveformGenerator:
 
         Raises:
             ValueError: If the buffer size exceeds the maximum buffer length.
+            DeviceError: If the device rejected a value of the buffer.
+            RuntimeError: If the read back value of a chunk does not match the written value.
         """
         if len(buffer) > self.NV200_WAVEFORM_BUFFER_SIZE:
             raise ValueError(
@@ -299,11 +319,29 @@ class WaveformGenerator:
             scaled_buffer = buffer
 
 
+        for percent in scaled_buffer:
+            if not 0 <= percent <= 100:
+                raise ValueError(f"Waveform value must be in the range from 0 to 100%, got {percent}")
+
         total = len(scaled_buffer)
-        for index, percent in enumerate(scaled_buffer):
-            await self.set_waveform_value_percent(index, percent)
+        for start in range(0, total, self.WAVEFORM_WRITE_CHUNK_SIZE):
+            chunk = scaled_buffer[start:start + self.WAVEFORM_WRITE_CHUNK_SIZE]
+            end = start + len(chunk)
+            try:
+                _, params = await self._dev.write_batch_and_read(
+                    [f"gbarb,{index},{percent}" for index, percent in enumerate(chunk, start)],
+                    f"gbarb,{end - 1}"
+                )
+            except DeviceError as e:
+                e.add_note(f"Writing waveform buffer indices {start} to {end - 1} failed")
+                raise
+            readback = float(params[1])
+            if not math.isclose(readback, chunk[-1], abs_tol=self.WAVEFORM_READBACK_TOLERANCE):
+                raise RuntimeError(
+                    f"Waveform buffer readback mismatch at index {end - 1}: wrote {chunk[-1]}, read {readback}"
+                )
             if on_progress:
-                await on_progress(index + 1, total)
+                await on_progress(end, total)
 
 
     async def read_waveform_buffer(
@@ -466,6 +504,20 @@ class WaveformGenerator:
         Returns:
             List[float]: Time samples (in milliseconds).
         """
+        return cls.generate_time_samples_array(freq_hz).tolist()
+    
+
+    @classmethod
+    def generate_time_samples_array(cls, freq_hz: float) -> np.ndarray:
+        """
+        Generates a NumPy array of time samples (in milliseconds) for one period of a waveform at the specified frequency.
+
+        Args:
+            freq_hz (float): The frequency of the waveform in Hertz.
+
+        Returns:
+            np.ndarray: Time samples (in milliseconds).
+        """
         if freq_hz <= 0:
             raise ValueError("Frequency must be greater than zero.")
 
@@ -480,21 +532,7 @@ class WaveformGenerator:
         sample_time_s = sample_time_us / 1_000_000
 
         required_buffer = int(period_us / sample_time_us)
-        return [i * sample_time_s * 1000 for i in range(required_buffer)]
-    
-
-    @classmethod
-    def generate_time_samples_array(cls, freq_hz: float) -> np.ndarray:
-        """
-        Generates a NumPy array of time samples (in milliseconds) for one period of a waveform at the specified frequency.
-
-        Args:
-            freq_hz (float): The frequency of the waveform in Hertz.
-
-        Returns:
-            np.ndarray: Time samples (in milliseconds).
-        """
-        return np.array(cls.generate_time_samples_list(freq_hz))
+        return np.arange(required_buffer, dtype=np.float64) * sample_time_s * 1000
 
     @classmethod
     def generate_sine_wave(
@@ -529,13 +567,15 @@ class WaveformGenerator:
 
         amplitude = (high_level - low_level) / 2.0
         offset = (high_level + low_level) / 2.0
-        values: List[float] = [
-            offset + amplitude * math.sin(2 * math.pi * freq_hz * (t_ms / 1000) + phase_shift_rad)
-            for t_ms in times_ms
-        ]
+        # Evaluate the sine in place on a single array to avoid temporaries per operation
+        y = times_ms * (2 * np.pi * freq_hz / 1000)
+        y += phase_shift_rad
+        np.sin(y, out=y)
+        y *= amplitude
+        y += offset
 
         return cls.WaveformData(
-            values=values,
+            values=y.tolist(),
             sample_time_ms=calculate_sampling_time_ms(times_ms)
         )
 